@@ -0,0 +1,318 @@
+import streamlit as st
+import pandas as pd
+import uuid
+import re
+import threading
+from datetime import datetime
+
+# --- CONFIGURAÇÃO DA CONEXÃO ---
+# O link da planilha de cada prédio fica no cadastro de prédios (predios.py)
+
+# Nomes exatos das abas que criamos no Google Sheets
+WORKSHEET_DADOS = "Dados"
+WORKSHEET_CONFIG = "Config"
+WORKSHEET_CONTROLE = "Controle"  # Uma célula: carimbo de versão da aba Dados
+
+COLUNAS_DADOS = ["ID", "Data", "Tipo", "Categoria", "Unidade", "Descrição", "Valor", "Status"]
+COLUNA_VERSAO = "Versao"
+
+list_meses_inv = {"Jan":1, "Fev":2, "Mar":3, "Abr":4, "Mai":5, "Jun":6, "Jul":7, "Ago":8, "Set":9, "Out":10, "Nov":11, "Dez":12, "Todos":13}
+
+# --- FUNÇÕES BÁSICAS ---
+def forcar_numero_bruto(valor):
+    try:
+        if pd.isna(valor): return 0.0
+        s_val = str(valor).strip()
+        # Remove simbolo de moeda se houver
+        s_val = s_val.replace("R$", "").replace("r$", "").strip()
+        if ',' in s_val and '.' in s_val: 
+            s_val = s_val.replace('.', '').replace(',', '.')
+        elif ',' in s_val: 
+            s_val = s_val.replace(',', '.')
+        s_val = re.sub(r'[^\d\.-]', '', s_val)
+        return float(s_val)
+    except:
+        return 0.0
+
+# --- FUNÇÕES BÁSICAS (ATUALIZADAS PARA CORRIGIR SOBREPOSIÇÃO) ---
+
+def get_conexao():
+    # Import tardio: o conector do Google só é carregado quando alguém lê/grava a planilha
+    from streamlit_gsheets import GSheetsConnection
+    return st.connection("gsheets", type=GSheetsConnection)
+
+def _ler_planilha_dados(conn, predio):
+    # ttl=0 obriga a ler do Google SEMPRE, sem usar memória velha
+    df = conn.read(spreadsheet=predio.url_planilha, worksheet=WORKSHEET_DADOS, ttl=0)
+    
+    cols_esperadas = COLUNAS_DADOS + [COLUNA_VERSAO]
+    if df.empty or len(df.columns) < 2:
+        return pd.DataFrame(columns=cols_esperadas)
+    
+    # Garante que ID seja string e limpa vazios
+    df["ID"] = df["ID"].astype(str)
+    df["ID"] = df["ID"].apply(lambda x: str(uuid.uuid4()) if pd.isna(x) or x == "nan" or x == "" else x)
+        
+    df["Data"] = pd.to_datetime(df["Data"], errors='coerce')
+    df = df.dropna(subset=["Data"])
+    
+    # Aplica a correção numérica
+    df["Valor"] = df["Valor"].apply(forcar_numero_bruto)
+    
+    df["Categoria"] = df["Categoria"].fillna("Lançamento Avulso") # Garante que nada fique vazio
+    df["Descrição"] = df["Descrição"].fillna("")
+    df["Unidade"] = df["Unidade"].astype(str).str.strip()
+    
+    # Versão da linha (planilhas antigas não têm a coluna: começa em 0)
+    if COLUNA_VERSAO not in df.columns: df[COLUNA_VERSAO] = 0
+    df[COLUNA_VERSAO] = pd.to_numeric(df[COLUNA_VERSAO], errors='coerce').fillna(0).astype(int)
+    
+    # Regra de legado
+    mask_divida = (df["Tipo"] == "Entrada") & (df["Valor"] < -0.01)
+    df.loc[mask_divida, "Categoria"] = "Ajuste/Gorjeta"
+        
+    return df
+
+def carregar_dados(predio):
+    conn = get_conexao()
+    try:
+        # Carimbo lido ANTES do livro: se alguém gravar no meio, o carimbo guardado fica velho (lado seguro)
+        versao_planilha = _ler_versao_planilha(conn, predio)
+        df = _ler_planilha_dados(conn, predio)
+        _atualizar_espelho(predio, versao_planilha, df)
+        return df
+    except Exception as e:
+        # Se der erro, tenta devolver um vazio para não travar a tela, mas avisa
+        # st.error(f"Erro de conexão: {e}") 
+        return pd.DataFrame(columns=COLUNAS_DADOS + [COLUNA_VERSAO])
+
+def dados_da_sessao(predio, df_atual=None):
+    # Base da sessão: o livro como este usuário o viu ao abrir a edição (com a Versao de cada linha).
+    # Fica fixa entre os reruns, até ele gravar ou pedir "Recarregar"; é contra ela que se mede o que ele mudou.
+    # df_atual: leitura recém-feita pela página, aproveitada se a sessão ainda não tem base
+    chave = _chave_base(predio)
+    if chave not in st.session_state:
+        df = carregar_dados(predio) if df_atual is None else df_atual
+        if df.empty:
+            return df  # Falha de leitura ou planilha vazia: tenta de novo no próximo rerun
+        _guardar_base(predio, df)
+    return st.session_state[chave].copy()
+
+def base_lida_em(predio):
+    # Quando a base da sessão foi lida (ou gravada) pela última vez; None se ainda não há base
+    return st.session_state.get(_chave_base(predio) + "_em")
+
+def recarregar_dados(predio):
+    # Descarta a base da sessão: o próximo dados_da_sessao relê a planilha
+    st.session_state.pop(_chave_base(predio), None)
+    st.session_state.pop(_chave_base(predio) + "_em", None)
+
+def base_desatualizada(df_base, df_atual):
+    # Alguém incluiu, excluiu ou editou (Versao subiu) linhas desde que a base foi lida
+    def _versoes(df):
+        return set(zip(df["ID"].astype(str), df[COLUNA_VERSAO].astype(int)))
+    return _versoes(df_base) != _versoes(df_atual)
+
+def aviso_conflito(predio):
+    # Aviso de linhas rejeitadas na última gravação; sobrevive ao st.rerun() e é mostrado uma vez
+    return st.session_state.pop(f"_aviso_conflito_{predio.chave}", None)
+
+def _guardar_base(predio, df):
+    st.session_state[_chave_base(predio)] = df.copy()
+    st.session_state[_chave_base(predio) + "_em"] = datetime.now()
+
+# --- CONTROLE DE CONCORRÊNCIA OTIMISTA ---
+# Cada linha tem uma "Versao" e a aba "Controle" guarda um carimbo da planilha inteira.
+# Na gravação só se envia o que esta sessão mudou (inclusões, edições, exclusões):
+#   - carimbo igual ao conhecido -> ninguém gravou desde então, grava sem reler o livro;
+#   - carimbo diferente -> relê o livro e rejeita só as linhas que outra pessoa mudou.
+
+@st.cache_resource
+def _espelho_planilha(chave_predio):
+    # Um por prédio, compartilhado por todas as sessões do processo: último estado gravado/lido e seu carimbo
+    return {"versao": None, "df": None, "trava": threading.Lock()}
+
+def _ler_versao_planilha(conn, predio):
+    # Sem a aba "Controle" (ou ainda sem carimbo): toda gravação relê o livro antes de aplicar as mudanças.
+    # Qualquer outra falha de leitura sobe: tratá-la como "sem carimbo" zeraria o carimbo na gravação
+    from gspread.exceptions import WorksheetNotFound
+    try:
+        df = conn.read(spreadsheet=predio.url_planilha, worksheet=WORKSHEET_CONTROLE, ttl=0)
+    except WorksheetNotFound:
+        return None
+    if df.empty or COLUNA_VERSAO not in df.columns:
+        return None
+    return int(forcar_numero_bruto(df[COLUNA_VERSAO].iloc[0]))
+
+def _gravar_versao_planilha(conn, predio, versao):
+    # Só a falta da aba "Controle" é tolerada (a planilha segue sem carimbo); qualquer outra falha sobe,
+    # antes de tocar no livro: um livro gravado com o carimbo velho faria os espelhos aceitarem dados vencidos
+    from gspread.exceptions import WorksheetNotFound
+    try:
+        conn.update(spreadsheet=predio.url_planilha, data=pd.DataFrame({COLUNA_VERSAO: [versao]}), worksheet=WORKSHEET_CONTROLE)
+        return True
+    except WorksheetNotFound:
+        return False
+
+def _chave_base(predio):
+    return f"_base_dados_{predio.chave}"
+
+def _atualizar_espelho(predio, versao_planilha, df):
+    espelho = _espelho_planilha(predio.chave)
+    with espelho["trava"]:
+        espelho["versao"] = versao_planilha
+        espelho["df"] = df.copy()
+
+def _assinatura_linhas(df):
+    # Hash do conteúdo de cada linha (sem ID/Versao), indexado por ID
+    conteudo = pd.DataFrame({
+        "Data": pd.to_datetime(df["Data"], errors='coerce').dt.strftime('%Y-%m-%d'),
+        "Valor": pd.to_numeric(df["Valor"], errors='coerce').fillna(0.0).round(2),
+    })
+    for col in ["Tipo", "Categoria", "Unidade", "Descrição", "Status"]:
+        conteudo[col] = df[col].fillna("").astype(str)
+    return pd.Series(pd.util.hash_pandas_object(conteudo, index=False).values, index=df["ID"].astype(str).values)
+
+def salvar_alteracoes(predio, inseridos=None, alterados=None, excluidos=(), versoes_base=None):
+    # Aplica só as mudanças desta sessão sobre o estado atual da planilha.
+    # versoes_base: {ID: Versao} das linhas como esta sessão as leu. Devolve a lista de IDs rejeitados.
+    inseridos = inseridos if inseridos is not None else pd.DataFrame(columns=COLUNAS_DADOS)
+    alterados = alterados if alterados is not None else pd.DataFrame(columns=COLUNAS_DADOS)
+    versoes_base = versoes_base or {}
+    conn = get_conexao()
+    espelho = _espelho_planilha(predio.chave)
+
+    with espelho["trava"]:
+        versao_atual = _ler_versao_planilha(conn, predio)
+        if versao_atual is not None and espelho["versao"] == versao_atual and espelho["df"] is not None:
+            remoto = espelho["df"]
+        else:
+            remoto = _ler_planilha_dados(conn, predio)
+
+        versoes_remotas = dict(zip(remoto["ID"].astype(str), remoto[COLUNA_VERSAO]))
+        ids_tocados = set(alterados["ID"].astype(str)) | set(excluidos)
+        rejeitados = [i for i in ids_tocados if versoes_remotas.get(i) != versoes_base.get(i)]
+
+        alterados_ok = alterados[~alterados["ID"].astype(str).isin(rejeitados)].copy()
+        excluidos_ok = set(excluidos) - set(rejeitados)
+        alterados_ok[COLUNA_VERSAO] = alterados_ok["ID"].astype(str).map(versoes_remotas).fillna(0).astype(int) + 1
+        inseridos = inseridos.copy()
+        inseridos[COLUNA_VERSAO] = 1
+
+        mantidos = remoto[~remoto["ID"].astype(str).isin(excluidos_ok | set(alterados_ok["ID"].astype(str)))]
+        df_final = pd.concat([mantidos, alterados_ok, inseridos], ignore_index=True).reindex(columns=COLUNAS_DADOS + [COLUNA_VERSAO])
+        # Linhas vindas dos formulários trazem datetime.date (st.date_input): mesma Data da leitura da planilha
+        df_final["Data"] = pd.to_datetime(df_final["Data"])
+
+        if not alterados_ok.empty or not inseridos.empty or excluidos_ok:
+            # Carimbo ANTES do livro: se o livro falhar depois, os outros só releem à toa (lado seguro)
+            nova_versao = (versao_atual or 0) + 1
+            espelho["versao"] = None
+            com_carimbo = _gravar_versao_planilha(conn, predio, nova_versao)
+
+            df_save = df_final.copy()
+            # Converte data para string para o Google não confundir formato
+            df_save["Data"] = df_save["Data"].dt.strftime('%Y-%m-%d')
+            conn.update(spreadsheet=predio.url_planilha, data=df_save, worksheet=WORKSHEET_DADOS)
+
+            espelho["versao"] = nova_versao if com_carimbo and versao_atual is not None else None
+            espelho["df"] = df_final.copy()
+
+            # Os caches de relatório são chaveados pela versão do conteúdo de cada prédio:
+            # não é preciso limpar o cache dos outros prédios a cada gravação
+            st.toast("Salvo na nuvem com sucesso!", icon="☁️")
+
+        # Nova base da sessão: o estado atual da planilha (linhas rejeitadas voltam com a versão da outra pessoa)
+        _guardar_base(predio, df_final)
+
+    if rejeitados:
+        st.session_state[f"_aviso_conflito_{predio.chave}"] = (
+            f"⚠️ {len(rejeitados)} lançamento(s) foram alterados por outra pessoa enquanto você editava e não foram gravados. Confira os valores atuais."
+        )
+    return rejeitados
+
+def acrescentar_dados(df_novos, predio):
+    # Só inclusões: nunca conflitam, e não exigem que a sessão tenha lido o livro
+    if df_novos.empty:
+        st.warning("Nada para salvar.")
+        return []
+    return salvar_alteracoes(predio, inseridos=df_novos)
+
+def salvar_dados(df, predio):
+    # Compara com a base que esta sessão leu e grava só a diferença
+    if df.empty:
+        st.warning("Nada para salvar.")
+        return []
+    # Sessão que ainda não leu o livro: df representa a planilha inteira, compara com a leitura atual
+    base = dados_da_sessao(predio)
+
+    df = df.copy()
+    df["ID"] = df["ID"].astype(str)
+    ids_base = set(base["ID"].astype(str))
+    ids_novos = set(df["ID"])
+
+    assin_base = _assinatura_linhas(base)
+    assin_nova = _assinatura_linhas(df)
+    comuns = df[df["ID"].isin(ids_base)]
+    mudou = assin_nova[comuns["ID"]].values != assin_base.reindex(comuns["ID"]).values
+
+    return salvar_alteracoes(
+        predio,
+        inseridos=df[~df["ID"].isin(ids_base)],
+        alterados=comuns[mudou],
+        excluidos=ids_base - ids_novos,
+        versoes_base=dict(zip(base["ID"].astype(str), base[COLUNA_VERSAO])),
+    )
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _ler_config(chave_predio):
+    # Lida a cada rerun pela barra lateral: guardada por prédio e descartada por salvar_config
+    from predios import obter_predio
+    return get_conexao().read(spreadsheet=obter_predio(chave_predio).url_planilha, worksheet=WORKSHEET_CONFIG, ttl=0)
+
+def carregar_config(predio):
+    try:
+        df = _ler_config(predio.chave)
+        if df.empty:
+             # Fallback se a aba config estiver vazia: padrões do cadastro do prédio
+            cats = list(predio.categorias_padrao); unis = list(predio.unidades_padrao)
+            max_len = max(len(cats), len(unis))
+            cats += [""] * (max_len - len(cats)); unis += [""] * (max_len - len(unis))
+            return pd.DataFrame({"Categorias": cats, "Unidades": unis})
+        return df.fillna("")
+    except:
+        return pd.DataFrame(columns=["Categorias", "Unidades"])
+
+def salvar_config(df, predio):
+    conn = get_conexao()
+    conn.update(spreadsheet=predio.url_planilha, data=df, worksheet=WORKSHEET_CONFIG)
+    # Só a leitura da Config deste prédio fica velha; os caches de relatório seguem valendo
+    _ler_config.clear(predio.chave)
+    st.toast("Configurações salvas!", icon="⚙️")
+
+def versao_dados(df):
+    # Impressão digital do conteúdo do livro: muda sempre que qualquer lançamento muda
+    if df is None or df.empty:
+        return 0
+    cols = [c for c in COLUNAS_DADOS if c in df.columns]
+    return int(pd.util.hash_pandas_object(df[cols], index=False).sum())
+
+def forcar_numero(valor):
+    return forcar_numero_bruto(valor)
+
+def formatar_real(valor):
+    texto = f"R$ {valor:,.2f}"
+    return texto.replace(",", "X").replace(".", ",").replace("X", ".")
+
+# --- REGRAS DE CLASSIFICAÇÃO ---
+def _mask_extras_rateio(df: pd.DataFrame, predio) -> pd.Series:
+    if df is None or df.empty:
+        return pd.Series([], dtype=bool)
+
+    desc = df["Descrição"].astype(str)
+    mask_alvo = desc.str.contains(predio.regex_alvos, case=False, regex=True, na=False)
+    mask_base = (
+        (df["Tipo"] == "Entrada")
+        & (~df["Categoria"].astype(str).str.contains("Rateio|Fundo|Ajuste|Saldo", case=False, regex=True, na=False))
+    )
+    return mask_base & mask_alvo
@@ -0,0 +1,8 @@
+# Cada página do app vive no seu próprio módulo e só é importada quando aberta,
+# para que dependências pesadas (Plotly, FPDF) não pesem na partida do app.
+PAGINAS = {
+    "Calculadora de Rateio": "paginas.calculadora",
+    "Extrato (Dashboard)": "paginas.dashboard",
+    "Entradas/Saídas Avulsas": "paginas.avulsos",
+    "Cadastros": "paginas.cadastros",
+}
@@ -0,0 +1,58 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import uuid
+
+from dados import acrescentar_dados
+
+# --- PÁGINA: LANÇAMENTOS AVULSOS ---
+def renderizar(predio, lista_cats, lista_unis):
+    st.header("💸 Lançamentos Avulsos")
+    t1, t2 = st.tabs(["Lançamento Avulso", "Definir Saldo Inicial"])
+    
+    with t1:
+        # MUDANÇA 1: clear_on_submit=True limpa os campos após clicar no botão
+        with st.form("av", clear_on_submit=True):
+            c1, c2 = st.columns(2)
+            dt = c1.date_input("Data", datetime.today())
+            tp = c2.selectbox("Tipo", ["Saída", "Entrada"])
+            
+            # Sem categoria na tela (automático no código)
+            un = st.selectbox("Unidade / Centro de Custo", ["Condomínio (Geral)"] + lista_unis)
+            vl = st.number_input("Valor (R$)", min_value=0.0, format="%.2f")
+            ds = st.text_input("Descrição (Ex: Venda de Sucata, Compra de Material)")
+            
+            enviar = st.form_submit_button("Salvar na Nuvem", type="primary")
+
+            if enviar:
+                if not ds:
+                    st.error("⚠️ Por favor, preencha a Descrição.")
+                elif vl == 0:
+                    st.warning("⚠️ O valor está zerado.")
+                else:
+                    novo_dado = pd.DataFrame([{
+                        "ID": str(uuid.uuid4()), 
+                        "Data": dt, 
+                        "Tipo": tp, 
+                        "Categoria": "Lançamento Avulso", 
+                        "Unidade": un, 
+                        "Descrição": ds, 
+                        "Valor": vl, 
+                        "Status": "Ok"
+                    }])
+                    
+                    acrescentar_dados(novo_dado, predio)
+                    
+                    # MUDANÇA 2: Mensagem visual forte e pausa para leitura
+                    st.success("✅ Lançamento salvo com sucesso! Os campos foram limpos.")
+                    import time
+                    time.sleep(1.5) # Espera 1.5 segundos antes de recarregar
+                    st.rerun()
+    with t2:
+        st.info("Define o saldo inicial histórico (antes de 2020).")
+        with st.form("si"):
+            dt = st.date_input("Data do Saldo Inicial", datetime(2020, 1, 1))
+            vl = st.number_input("Valor Inicial (R$)", min_value=0.0, format="%.2f")
+            if st.form_submit_button("Registrar Saldo", type="primary"):
+                novo_dado = pd.DataFrame([{"ID":str(uuid.uuid4()), "Data":dt, "Tipo":"Entrada", "Categoria":"Saldo Inicial", "Unidade":"Caixa", "Descrição":"Saldo Inicial", "Valor":vl, "Status":"Ok"}])
+                acrescentar_dados(novo_dado, predio)
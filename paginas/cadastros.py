@@ -0,0 +1,18 @@
+import streamlit as st
+import pandas as pd
+
+from dados import salvar_config
+
+# --- PÁGINA: CADASTROS ---
+def renderizar(predio, lista_cats, lista_unis):
+    # Esta aba foi ocultada do menu, mas o código permanece para manutenção
+    st.header("⚙️ Configurações")
+    c1, c2 = st.columns(2)
+    d_c = c1.data_editor(pd.DataFrame({"Categoria":lista_cats}), num_rows="dynamic", width="stretch", key="ed_cats")
+    d_u = c2.data_editor(pd.DataFrame({"Unidade":lista_unis}), num_rows="dynamic", width="stretch", key="ed_unis")
+    if st.button("Salvar Configurações", type="primary"):
+        cats = d_c["Categoria"].tolist(); unis = d_u["Unidade"].tolist()
+        max_len = max(len(cats), len(unis))
+        cats += [""] * (max_len - len(cats)); unis += [""] * (max_len - len(unis))
+        salvar_config(pd.DataFrame({"Categorias": cats, "Unidades": unis}), predio)
+        st.rerun()
@@ -0,0 +1,237 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import uuid
+
+from dados import acrescentar_dados, forcar_numero, formatar_real
+from simulador import grade_cenarios, simular_cenarios, MAX_CENARIOS
+
+# --- SIMULADOR DE CENÁRIOS ---
+def _lista_valores(texto):
+    # "100; 150,50; 200" -> [100.0, 150.5, 200.0]
+    valores = [forcar_numero(v) for v in str(texto).split(";") if v.strip()]
+    return valores or [0.0]
+
+@st.fragment
+def _simulador_cenarios(predio, lista_unis, total_agua, total_luz, total_limp, val_fundo):
+    # Fragmento: mexer no simulador só reexecuta este trecho, sem recarregar a página inteira.
+    # O corpo do expander roda mesmo fechado: nada é simulado (nem o Plotly carregado) até ativar
+    if not st.toggle("Ativar simulador", key="sim_ativo"):
+        return
+    st.caption("Informe vários valores separados por ponto e vírgula (ex: 50; 75; 100). Todas as combinações são calculadas de uma vez.")
+    s1, s2, s3, s4 = st.columns(4)
+    fundos = _lista_valores(s1.text_input("Fundo de Caixa (R$)", f"{val_fundo:.2f}", key="sim_fundo"))
+    aguas = _lista_valores(s2.text_input("Total Água (R$)", f"{total_agua:.2f}", key="sim_agua"))
+    luzes = _lista_valores(s3.text_input("Total Luz (R$)", f"{total_luz:.2f}", key="sim_luz"))
+    limpezas = _lista_valores(s4.text_input("Total Limpeza (R$)", f"{total_limp:.2f}", key="sim_limp"))
+    s5, s6 = st.columns([1, 2])
+    extras = _lista_valores(s5.text_input("Extras - Valor Total (R$)", "0.00", key="sim_extra"))
+    alvos = s6.multiselect("Ratear Extras Para", predio.alvos_rateio, default=predio.alvos_rateio, key="sim_alvos") or ["Todos"]
+
+    qtd_cenarios = len(fundos) * len(aguas) * len(luzes) * len(limpezas) * len(extras) * len(alvos)
+    if qtd_cenarios > MAX_CENARIOS:
+        st.error(f"⚠️ {qtd_cenarios} cenários: reduza as combinações (máximo {MAX_CENARIOS}).")
+        return
+
+    df_sim = simular_cenarios(predio, lista_unis, grade_cenarios(fundos, aguas, luzes, limpezas, extras, alvos))
+    cols_cota = [c for c in df_sim.columns if c.startswith("Cota ")]
+    st.write(f"**{qtd_cenarios} cenário(s) calculado(s)**")
+
+    cols_moeda = ["Fundo", "Água", "Luz", "Limpeza", "Extra Total", "Total Arrecadado"] + cols_cota
+    st.dataframe(
+        df_sim, hide_index=True, use_container_width=True,
+        column_config={c: st.column_config.NumberColumn(format="R$ %.2f") for c in cols_moeda},
+    )
+
+    # Import tardio: o Plotly só é carregado quando o simulador é usado
+    import plotly.express as px
+    passo = max(len(df_sim) // 2000, 1)  # Gráfico com no máximo ~2000 cenários; a tabela mostra todos
+    df_graf = df_sim.iloc[::passo].melt(id_vars=["Total Arrecadado", "Fundo", "Ratear Para"], value_vars=cols_cota, var_name="Grupo", value_name="Cota")
+    fig = px.scatter(df_graf, x="Total Arrecadado", y="Cota", color="Grupo", hover_data=["Fundo", "Ratear Para"], title="Cota por Unidade x Total Arrecadado", height=350)
+    st.plotly_chart(fig, use_container_width=True)
+
+# --- PÁGINA: CALCULADORA DE RATEIO ---
+def renderizar(predio, lista_cats, lista_unis):
+    grupos = predio.grupos
+    unis_grupo = {g.nome: predio.unidades_do_grupo(lista_unis, g) for g in grupos}
+
+    # Pré-visualização pendente de outro prédio não vale para este
+    if st.session_state.get('dados_rateio', {}).get('predio', predio.chave) != predio.chave:
+        del st.session_state['dados_rateio']
+        st.session_state.pop('df_preview', None)
+
+    st.header("🧮 Calculadora de Rateio")
+    st.info("Unidades: " + ", ".join(f"{predio.qtd_grupo(lista_unis, g)} {g.titulo.title()}" for g in grupos) + ".")
+
+    with st.container(border=True):
+        col1, col2 = st.columns(2)
+        data_ref = col1.date_input("Data de Vencimento/Referência", datetime.today())
+        c_agua, c_luz, c_limp = st.columns(3)
+        total_agua = c_agua.number_input("Total Água (R$)", min_value=0.0, format="%.2f")
+        total_luz = c_luz.number_input("Total Luz (R$)", min_value=0.0, format="%.2f")
+        total_limp = c_limp.number_input("Total Limpeza (R$)", min_value=0.0, format="%.2f")
+        st.divider()
+        st.subheader("2. Fundos e Extras")
+        cf1, cf2 = st.columns([1, 2])
+        val_fundo = cf1.number_input("Fundo de Caixa (Valor Unitário)", min_value=0.0, format="%.2f")
+        with cf2:
+            st.write("Tabela de Despesas Extras:")
+            if 'extras_editor' not in st.session_state:
+                st.session_state['extras_editor'] = pd.DataFrame(columns=["Descrição", "Categoria", "Valor Total", "Ratear Para"])
+            
+            # MUDANÇA: Filtro para ocultar Água, Luz e Limpeza nos Extras
+            bloqueadas_extras = ["Água", "Luz", "Limpeza Escadas", "Pagto Água/Esgoto", "Pagto Luz", "Pagto Limpeza"]
+            lista_cats_extras = [x for x in lista_cats if x not in bloqueadas_extras]
+
+            df_extras_input = st.data_editor(
+                st.session_state['extras_editor'],
+                num_rows="dynamic",
+                column_config={
+                    "Descrição": st.column_config.TextColumn(required=True, width="medium"),
+                    # Usando a lista filtrada aqui
+                    "Categoria": st.column_config.SelectboxColumn(options=lista_cats_extras, required=True, width="medium"),
+                    "Valor Total": st.column_config.NumberColumn(format="R$ %.2f", required=True),
+                    "Ratear Para": st.column_config.SelectboxColumn(options=predio.alvos_rateio, required=True, default="Todos")
+                },
+                key="extras_table"
+            )
+        st.divider()
+
+    with st.expander("🔬 Simulador de Cenários (comparar combinações antes da assembleia)"):
+        _simulador_cenarios(predio, lista_unis, total_agua, total_luz, total_limp, val_fundo)
+
+    rateio_por_grupo = {g.nome: predio.rateio_grupo(lista_unis, g, total_agua, total_luz, total_limp) for g in grupos}
+
+    if st.button("Calcular e Pré-Visualizar", type="primary"):
+        df_extras_clean = df_extras_input.copy()
+        if not df_extras_clean.empty:
+            df_extras_clean["Valor Total"] = df_extras_clean["Valor Total"].apply(forcar_numero)
+
+        st.session_state['dados_rateio'] = {
+            'predio': predio.chave, 'data': data_ref, 'rateios': rateio_por_grupo, 'fundo': val_fundo,
+            'extras_df': df_extras_clean,
+            'totais': {'agua': total_agua, 'luz': total_luz, 'limp': total_limp}
+        }
+        
+        def calcular_total_extra_por_unidade(grupo, df_ex):
+            soma = 0.0
+            if df_ex is not None and not df_ex.empty:
+                for _, row in df_ex.iterrows():
+                    val = row["Valor Total"]
+                    target = str(row.get("Ratear Para", "Todos"))
+                    if predio.aplica_alvo(target, grupo): soma += val / predio.divisor_alvo(lista_unis, target)
+            return soma
+
+        lista = []
+        for grupo in grupos:
+            rateio_val = rateio_por_grupo[grupo.nome]
+            extra_val = calcular_total_extra_por_unidade(grupo, df_extras_clean)
+            for uni in unis_grupo[grupo.nome]:
+                total_base = rateio_val + val_fundo + extra_val
+                lista.append({"Unidade": uni, "Rateio": rateio_val, "Fundo": val_fundo, "Extra": extra_val, "Ajuste": 0.0, "Total Devido": total_base, "Valor Pago": total_base, "Status": "Ok"})
+        
+        st.session_state['df_preview'] = pd.DataFrame(lista)
+
+    if 'dados_rateio' in st.session_state and 'df_preview' in st.session_state:
+        d = st.session_state['dados_rateio']
+        st.divider()
+        
+        st.subheader("📋 Resumo do Rateio")
+        df_prev_temp = st.session_state['df_preview']
+        
+        for col_res, grupo in zip(st.columns(len(grupos)), grupos):
+            try: ex_grupo = df_prev_temp[df_prev_temp['Unidade'].isin(unis_grupo[grupo.nome])].iloc[0]['Total Devido']
+            except: ex_grupo = 0
+            with col_res: st.info(f"**{grupo.titulo}**: Padrão {formatar_real(ex_grupo)}")
+        
+        st.divider()
+        st.subheader("Edição Individual e Pagamento Parcial")
+
+        edited_df = st.data_editor(
+            st.session_state['df_preview'], 
+            hide_index=True, 
+            column_config={
+                "Rateio": st.column_config.NumberColumn(format="R$ %.2f", disabled=True),
+                "Fundo": st.column_config.NumberColumn(format="R$ %.2f", disabled=True),
+                "Extra": st.column_config.NumberColumn(format="R$ %.2f", disabled=True),
+                "Ajuste": st.column_config.NumberColumn("Ajuste (+/-)", format="R$ %.2f", required=True),
+                "Total Devido": st.column_config.NumberColumn(format="R$ %.2f", disabled=True),
+                "Valor Pago": st.column_config.NumberColumn("Valor Pago", format="R$ %.2f", required=True),
+                "Status": st.column_config.TextColumn(disabled=True)
+            }
+        )
+
+        recalc = False
+        for i, row in edited_df.iterrows():
+            base = row["Rateio"] + row["Fundo"] + row["Extra"]
+            ajuste = float(row.get("Ajuste", 0.0))
+            novo_devido = base + ajuste
+            
+            if abs(row["Total Devido"] - novo_devido) > 0.01:
+                edited_df.at[i, "Total Devido"] = novo_devido
+                edited_df.at[i, "Valor Pago"] = novo_devido
+                recalc = True
+            
+            pago = float(edited_df.at[i, "Valor Pago"])
+            devido = float(edited_df.at[i, "Total Devido"])
+            
+            novo_status = "Ok"
+            if pago < devido:
+                falta = devido - pago
+                novo_status = f"Pendente (Falta R$ {falta:.2f})"
+            elif pago > devido:
+                sobra = pago - devido
+                novo_status = f"Ok (+ R$ {sobra:.2f})"
+            if row["Status"] != novo_status:
+                edited_df.at[i, "Status"] = novo_status
+                recalc = True
+        
+        if recalc:
+            st.session_state['df_preview'] = edited_df
+            st.rerun()
+
+        if st.button("🚀 Confirmar e Lançar na Nuvem", type="primary"):
+            novos = []
+            extras_config_df = d['extras_df'] 
+
+            for i, row in edited_df.iterrows():
+                st_r = row['Status']
+                # val_pago = float(row["Valor Pago"]) # Não usado na lógica de escrita, mas na de status
+                val_devido = float(row["Total Devido"])
+                val_pago = float(row["Valor Pago"])
+                diferenca = val_pago - val_devido 
+                val_ajuste_individual = float(row["Ajuste"])
+
+                novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Entrada", "Categoria": "Rateio Despesas (Água/Luz)", "Unidade": row['Unidade'], "Descrição": "Rateio", "Valor": row['Rateio'], "Status": st_r})
+                if row['Fundo']>0: novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Entrada", "Categoria": "Fundo de Reserva", "Unidade": row['Unidade'], "Descrição": "Fundo", "Valor": row['Fundo'], "Status": st_r})
+                
+                if not extras_config_df.empty:
+                    for _, ext_row in extras_config_df.iterrows():
+                        val_total = forcar_numero(ext_row.get("Valor Total", 0.0))
+                        target = str(ext_row["Ratear Para"])
+                        desc_extra = ext_row["Descrição"]
+                        cat_extra = ext_row["Categoria"] 
+                        grupo_uni = predio.grupo_da_unidade(row['Unidade'])
+                        aplica = grupo_uni is not None and predio.aplica_alvo(target, grupo_uni)
+                        div_por = predio.divisor_alvo(lista_unis, target)
+                        if aplica and div_por > 0:
+                            val_indiv = val_total / div_por
+                            if val_indiv > 0:
+                                novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Entrada", "Categoria": cat_extra, "Unidade": row['Unidade'], "Descrição": f"{desc_extra} ({target})", "Valor": val_indiv, "Status": st_r})
+
+                if val_ajuste_individual != 0:
+                    novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Entrada", "Categoria": "Ajuste/Gorjeta", "Unidade": row['Unidade'], "Descrição": "Ajuste Manual", "Valor": val_ajuste_individual, "Status": st_r})
+
+                if diferenca != 0:
+                    novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Entrada", "Categoria": "Ajuste/Gorjeta", "Unidade": row['Unidade'], "Descrição": "Pendência (Falta)" if diferenca < 0 else "Sobra Pagamento", "Valor": diferenca, "Status": st_r})
+            
+            if d['totais']['agua']>0: novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Saída", "Categoria": "Pagto Água/Esgoto", "Unidade": "Condomínio", "Descrição": "Conta Água", "Valor": d['totais']['agua'], "Status": "Ok"})
+            if d['totais']['luz']>0: novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Saída", "Categoria": "Pagto Luz", "Unidade": "Condomínio", "Descrição": "Conta Luz", "Valor": d['totais']['luz'], "Status": "Ok"})
+            if d['totais']['limp']>0: novos.append({"ID": str(uuid.uuid4()), "Data": d['data'], "Tipo": "Saída", "Categoria": "Pagto Limpeza", "Unidade": "Condomínio", "Descrição": "Limpeza", "Valor": d['totais']['limp'], "Status": "Ok"})
+            
+            # Só inclusões: grava sem reler o livro se ninguém mexeu na planilha
+            acrescentar_dados(pd.DataFrame(novos), predio)
+            
+            del st.session_state['dados_rateio']
+            del st.session_state['df_preview']
+            st.rerun()
@@ -0,0 +1,207 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import uuid
+import os
+
+from dados import carregar_dados, dados_da_sessao, base_lida_em, recarregar_dados, aviso_conflito, salvar_dados, acrescentar_dados, base_desatualizada, formatar_real
+from relatorio import gerar_relatorio_prestacao, gerar_extratos_unidades, obter_relatorio, obter_fluxo_caixa, metricas_periodo, FREQUENCIAS, renderizar as renderizar_relatorio, RENDERIZADORES
+
+# --- PÁGINA: EXTRATO (DASHBOARD) ---
+def renderizar(predio, lista_cats, lista_unis):
+    # Import tardio: o Plotly só é carregado quando o Dashboard é aberto
+    import plotly.express as px
+
+    # Gráficos, cartões e relatórios usam sempre a leitura atual da planilha.
+    # A tabela de edição parte da base da sessão (fixa até gravar ou recarregar), para detectar conflitos
+    df = carregar_dados(predio)
+    df_base = dados_da_sessao(predio, df)
+
+    st.header(f"📊 Dashboard - {predio.nome}")
+    if df.empty:
+        st.warning("⚠️ Nenhum dado encontrado na Planilha."); st.stop()
+
+    df["Ano"] = df["Data"].dt.year
+    df["Mes"] = df["Data"].dt.month
+    
+    with st.container(border=True):
+        c1, c2, c3 = st.columns(3)
+        ano_atual = datetime.today().year
+        anos_possiveis = list(range(2020, ano_atual + 2))
+        anos_dados = sorted(df["Ano"].dropna().unique().tolist())
+        lista_anos = ["Todos"] + sorted(list(set(anos_possiveis + anos_dados)))
+        
+        idx_ano = 0
+        if ano_atual in lista_anos: idx_ano = lista_anos.index(ano_atual)
+        
+        ano = c1.selectbox("Ano", lista_anos, index=idx_ano)
+        meses = {1:"Jan", 2:"Fev", 3:"Mar", 4:"Abr", 5:"Mai", 6:"Jun", 7:"Jul", 8:"Ago", 9:"Set", 10:"Out", 11:"Nov", 12:"Dez", 13:"Todos"}
+        mes_key = c2.selectbox("Mês", list(meses.keys()), format_func=lambda x: meses[x], index=12)
+        tipo = c3.selectbox("Tipo", ["Todos", "Entrada", "Saída"])
+
+    def _recorte(d):
+        if ano != "Todos": d = d[d["Data"].dt.year == ano]
+        if mes_key != 13: d = d[d["Data"].dt.month == mes_key]
+        if tipo != "Todos": d = d[d["Tipo"] == tipo]
+        return d
+
+    df_ver = _recorte(df)
+    df_ver_base = _recorte(df_base)
+
+    st.subheader("Visão Geral")
+    if not df_ver.empty:
+        g1, g2 = st.columns(2)
+        totais = df_ver.groupby("Tipo")["Valor"].sum().reset_index()
+        fig1 = px.bar(totais, x="Tipo", y="Valor", color="Tipo", title="Receitas vs Despesas", color_discrete_map={"Entrada": "#2ecc71", "Saída": "#e74c3c"}, height=300)
+        g1.plotly_chart(fig1, use_container_width=True)
+        df_ent = df_ver[df_ver["Tipo"]=="Entrada"]
+        if not df_ent.empty:
+            fig2 = px.pie(df_ent, names="Status", values="Valor", title="Status de Recebimento", color="Status", color_discrete_map={"Ok": "#3498db", "Pendente": "#f1c40f"}, height=300)
+            g2.plotly_chart(fig2, use_container_width=True)
+    else: st.info("Sem dados para exibir.")
+    
+    # --- PAINEL DE INADIMPLÊNCIA ---
+    st.divider()
+    st.subheader("🚨 Controle de Inadimplência")
+    
+    mask_divida_pura = (df["Tipo"] == "Entrada") & (df["Valor"] < -0.01)
+    mask_recuperacao = (df["Tipo"] == "Entrada") & (df["Valor"] > 0) & (df["Categoria"].str.contains("Ajuste", case=False, na=False))
+    df_ajustes_global = df[mask_divida_pura | mask_recuperacao]
+    
+    devedores_list = []
+    if not df_ajustes_global.empty:
+        saldo_por_unidade = df_ajustes_global.groupby("Unidade")["Valor"].sum().reset_index()
+        devedores = saldo_por_unidade[saldo_por_unidade["Valor"] < -0.05] 
+        
+        if not devedores.empty:
+            st.error(f"Total Pendente: {formatar_real(devedores['Valor'].sum())}")
+            
+            devedores_show = devedores.rename(columns={"Valor": "Saldo Devedor"}).copy()
+            devedores_show["Saldo Devedor"] = devedores_show["Saldo Devedor"].apply(formatar_real)
+            st.dataframe(devedores_show, use_container_width=True)
+            devedores_list = devedores["Unidade"].tolist()
+            
+            # BAIXA RÁPIDA
+            st.write("---")
+            st.write("💰 **Baixa Rápida de Pendências**")
+            c_pay1, c_pay2, c_pay3 = st.columns([2, 1, 1])
+            uni_pag = c_pay1.selectbox("Selecione a Unidade para Baixar", devedores_list)
+            dt_pagamento = c_pay2.date_input("Data do Pagamento", datetime.today())
+            valor_divida_atual = 0.0
+            if uni_pag:
+                val_calc = devedores[devedores["Unidade"]==uni_pag]["Valor"].values
+                if len(val_calc) > 0: valor_divida_atual = abs(val_calc[0])
+            valor_pag = c_pay3.number_input("Valor Recebido (R$)", min_value=0.0, value=valor_divida_atual, format="%.2f")
+            
+            if st.button("Registrar Pagamento da Dívida", type="primary"):
+                novo_pagamento = {
+                    "ID": str(uuid.uuid4()), "Data": dt_pagamento, "Tipo": "Entrada", "Categoria": "Ajuste/Gorjeta", "Unidade": uni_pag, "Descrição": f"Recuperação de Atrasados - {uni_pag}", "Valor": valor_pag, "Status": "Ok"
+                }
+                acrescentar_dados(pd.DataFrame([novo_pagamento]), predio)
+                st.rerun()
+        else:
+            st.success("Nenhuma pendência financeira encontrada.")
+    else:
+        st.success("Nenhuma pendência registrada.")
+
+    st.divider()
+    st.subheader("Detalhamento e Edição")
+    aviso = aviso_conflito(predio)
+    if aviso: st.warning(aviso)
+
+    c_info, c_rec = st.columns([4, 1])
+    lida_em = base_lida_em(predio)
+    if lida_em is not None:
+        if base_desatualizada(df_base, df):
+            c_info.info(f"ℹ️ A planilha mudou desde que esta tabela foi carregada ({lida_em:%d/%m %H:%M}). Recarregue para editar sobre os dados atuais.")
+        else:
+            c_info.caption(f"Tabela carregada em {lida_em:%d/%m/%Y %H:%M}.")
+    if c_rec.button("🔄 Recarregar", help="Traz para a tabela as mudanças feitas por outras pessoas"):
+        recarregar_dados(predio)
+        st.rerun()
+    
+    # Cria a variável para limpar o índice e sumir com o aviso amarelo
+    df_ver_reset = df_ver_base.reset_index(drop=True)
+    
+    df_editado = st.data_editor(
+        df_ver_reset, 
+        hide_index=True, 
+        width="stretch", # CORREÇÃO DE LARGURA
+        num_rows="dynamic",
+        column_order=["Data", "Tipo", "Categoria", "Unidade", "Descrição", "Valor", "Status"],
+        column_config={
+            "Valor": st.column_config.NumberColumn(format="R$ %.2f"),
+            "Data": st.column_config.DateColumn(format="DD/MM/YYYY"),
+            "Status": st.column_config.SelectboxColumn(options=["Ok", "Pendente"], required=True),
+            "Categoria": st.column_config.SelectboxColumn(options=lista_cats, required=True),
+            "Unidade": st.column_config.SelectboxColumn(options=lista_unis, required=True),
+            "Tipo": st.column_config.SelectboxColumn(options=["Entrada", "Saída"], required=True)
+        }
+    )
+
+    if st.button("💾 Salvar Alterações na Nuvem", type="primary"):
+        # Lógica de exclusão/edição baseada no ID
+        # Parte da base lida nesta sessão; salvar_dados grava só a diferença e checa as versões
+        df_orig = df_base.copy()
+        
+        # Garante IDs na tabela editada (o editor devolve o mesmo índice de df_ver_reset; linhas novas vêm sem ID)
+        df_editado["ID"] = df_ver_reset["ID"]
+        for i, row in df_editado.iterrows():
+            if pd.isna(row["ID"]) or row["ID"] == "": df_editado.at[i, "ID"] = str(uuid.uuid4())
+        
+        ids_visualizados = df_ver_base["ID"].tolist()
+        ids_finais = df_editado["ID"].tolist()
+        ids_para_excluir = set(ids_visualizados) - set(ids_finais)
+        
+        # Remove excluídos
+        if ids_para_excluir: 
+            df_orig = df_orig[~df_orig["ID"].isin(ids_para_excluir)]
+        
+        # Atualiza editados
+        ids_editados = df_editado["ID"].tolist()
+        df_orig = df_orig[~df_orig["ID"].isin(ids_editados)]
+        
+        df_final = pd.concat([df_orig, df_editado], ignore_index=True)
+        salvar_dados(df_final, predio)
+        st.rerun()
+
+    st.divider()
+    # Prestação de contas calculada uma vez por período/versão dos dados (cacheada)
+    nome_mes = list(meses.keys())[list(meses.values()).index(meses[mes_key])]
+    modelo = obter_relatorio(df, mes_key, nome_mes, ano, lista_unis, predio)
+
+    e_per, s_per, delta_val = metricas_periodo(df_ver, predio)
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Entradas (Período)", formatar_real(e_per))
+    c2.metric("Saídas (Período)", formatar_real(s_per))
+    c3.metric("Saldo em Caixa (Acumulado)", formatar_real(modelo.saldo_acumulado), delta=f"Res. Período: {formatar_real(delta_val)}")
+
+    st.subheader("📈 Fluxo de Caixa")
+    freq_label = st.radio("Granularidade", list(FREQUENCIAS.keys()), index=1, horizontal=True, key="freq_fluxo")
+    serie = obter_fluxo_caixa(df, predio, FREQUENCIAS[freq_label])
+    if not serie.empty:
+        serie_plot = serie.rename_axis("Data").reset_index()
+        fig3 = px.line(serie_plot, x="Data", y="Saldo", hover_data=["Entradas", "Saídas", "Extras"], title="Saldo em Caixa (Histórico)", height=300)
+        st.plotly_chart(fig3, use_container_width=True)
+        st.caption("Entradas, Saídas e Extras de cada ponto somam o movimento desde o ponto anterior do gráfico.")
+
+    with st.expander("👁️ Pré-visualizar Prestação de Contas"):
+        st.markdown(renderizar_relatorio(modelo, "html"), unsafe_allow_html=True)
+
+    b1, b2, b3 = st.columns(3)
+    if b1.button("📄 Gerar Relatório (PDF)", type="primary"):
+        arq = gerar_relatorio_prestacao(df, mes_key, nome_mes, ano, lista_unis, predio)
+        with open(arq, "rb") as f:
+            b1.download_button("Baixar PDF Agora", f, file_name=os.path.basename(arq), type="primary")
+
+    _, ext_csv, mime_csv = RENDERIZADORES["csv"]
+    b2.download_button("📑 Baixar Prestação (CSV)", renderizar_relatorio(modelo, "csv"), file_name=f"{modelo.nome_base}.{ext_csv}", mime=mime_csv)
+
+    if b3.button("🗂️ Gerar Extratos por Unidade (ZIP)", type="primary"):
+        zip_bytes = gerar_extratos_unidades(df, mes_key, meses[mes_key], ano, lista_unis, predio)
+        if zip_bytes is None:
+            b3.warning("Nenhuma unidade cadastrada.")
+        else:
+            nome_zip = "Extratos_Todos.zip" if ano == "Todos" else f"Extratos_{meses[mes_key]}_{ano}.zip"
+            b3.download_button("Baixar Extratos (ZIP)", zip_bytes, file_name=nome_zip, mime="application/zip", type="primary")
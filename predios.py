@@ -0,0 +1,81 @@
+import re
+from dataclasses import dataclass
+
+# --- CADASTRO DE PRÉDIOS ---
+# Cada prédio tem sua própria planilha (partição dos dados) e suas regras de rateio.
+# Trocar de prédio na barra lateral é só uma consulta neste dicionário.
+
+@dataclass(frozen=True)
+class GrupoUnidades:
+    nome: str            # Trecho que identifica a unidade no nome (ex: "Sala" em "Sala 01")
+    titulo: str          # Plural usado nos relatórios (ex: "SALAS")
+    alvo: str            # Opção de "Ratear Para" dos extras (ex: "Só Salas")
+    agua_pct: float      # Fatia da conta de água paga pelo grupo
+    usa_luz_limp: bool   # Se o grupo também paga Luz e Limpeza
+
+@dataclass(frozen=True)
+class Predio:
+    chave: str
+    nome: str
+    url_planilha: str
+    grupos: tuple
+    categorias_padrao: tuple = ()
+    unidades_padrao: tuple = ()
+
+    def grupo_da_unidade(self, unidade):
+        for grupo in self.grupos:
+            if grupo.nome in str(unidade):
+                return grupo
+        return None
+
+    def unidades_do_grupo(self, lista_unis, grupo):
+        return [u for u in lista_unis if self.grupo_da_unidade(u) is grupo]
+
+    def qtd_grupo(self, lista_unis, grupo):
+        # Nunca zero, para não dividir por zero nos rateios
+        return max(len(self.unidades_do_grupo(lista_unis, grupo)), 1)
+
+    def divisor_alvo(self, lista_unis, alvo):
+        # Em quantas unidades um extra "Ratear Para" = alvo é dividido
+        if "Todos" in alvo:
+            return sum(self.qtd_grupo(lista_unis, g) for g in self.grupos)
+        for grupo in self.grupos:
+            if alvo == grupo.alvo:
+                return self.qtd_grupo(lista_unis, grupo)
+        return 0
+
+    def aplica_alvo(self, alvo, grupo):
+        return "Todos" in alvo or alvo == grupo.alvo
+
+    def rateio_grupo(self, lista_unis, grupo, total_agua, total_luz, total_limp):
+        # Cota de rateio de cada unidade do grupo (água pela fatia do grupo; luz/limpeza se o grupo paga)
+        total = total_agua * grupo.agua_pct + ((total_luz + total_limp) if grupo.usa_luz_limp else 0)
+        return total / self.qtd_grupo(lista_unis, grupo)
+
+    @property
+    def alvos_rateio(self):
+        return ["Todos"] + [g.alvo for g in self.grupos]
+
+    @property
+    def regex_alvos(self):
+        # Aceita também as grafias sem acento ("So Salas")
+        alvos = set(self.alvos_rateio) | {a.replace("Só", "So") for a in self.alvos_rateio}
+        return r"\(\s*\['?(?:" + "|".join(re.escape(a) for a in sorted(alvos)) + ")"
+
+SAN_RAFAEL = Predio(
+    chave="san_rafael",
+    nome="Edifício San Rafael",
+    url_planilha="https://docs.google.com/spreadsheets/d/1pwcXngnXhtmcxi0ucfl_ajKza5V-Ij_PgQ6Ce6jFpLM/edit?usp=sharing",
+    grupos=(
+        GrupoUnidades("Sala", "SALAS", "Só Salas", 0.35, False),
+        GrupoUnidades("Apto", "APARTAMENTOS", "Só Aptos", 0.65, True),
+    ),
+    categorias_padrao=("Rateio Despesas (Água/Luz)", "Fundo de Reserva", "Taxa Extra", "Ajuste/Gorjeta", "Saldo Inicial", "Pagto Água/Esgoto", "Pagto Luz", "Pagto Limpeza", "Manutenção", "Obras/Melhorias"),
+    unidades_padrao=("Apto 101", "Apto 201", "Apto 202", "Apto 301", "Sala 01", "Sala 02", "Sala 03", "Sala 04"),
+)
+
+# ⚠️ IMPORTANTE: para cadastrar um novo prédio, acrescente aqui com o link da planilha dele
+PREDIOS = {p.chave: p for p in [SAN_RAFAEL]}
+
+def obter_predio(chave):
+    return PREDIOS[chave]
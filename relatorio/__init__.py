@@ -0,0 +1,54 @@
+import streamlit as st
+import os
+
+from dados import versao_dados
+from predios import obter_predio
+from relatorio.modelo import construir_relatorio, metricas_periodo
+from relatorio.render_pdf import renderizar_pdf
+from relatorio.render_html import renderizar_html
+from relatorio.render_csv import renderizar_csv
+from relatorio.extratos import gerar_extratos_unidades
+from relatorio.fluxo import serie_fluxo_caixa, reduzir_pontos, FREQUENCIAS
+
+# --- ARQUITETURA DE PASTAS (Apenas para PDFs temporários) ---
+PASTA_RELATORIOS = 'relatorios'
+
+# Renderizadores plugáveis: formato -> (função(modelo), extensão, mime)
+RENDERIZADORES = {
+    "pdf": (renderizar_pdf, "pdf", "application/pdf"),
+    "html": (renderizar_html, "html", "text/html"),
+    "csv": (renderizar_csv, "csv", "text/csv"),
+}
+
+# Cada gravação muda a versão dos dados: max_entries descarta as versões antigas
+@st.cache_data(show_spinner=False, max_entries=32)
+def _relatorio_cacheado(chave_predio, versao, mes_num, mes_nome, ano_ref, unis, _df):
+    # _df não entra na chave do cache: prédio + versão dos dados já identificam o conteúdo
+    return construir_relatorio(_df, mes_num, mes_nome, ano_ref, list(unis), obter_predio(chave_predio))
+
+def obter_relatorio(df_completo, mes_num, mes_nome, ano_ref, lista_unis_config, predio):
+    # Cada período é calculado uma única vez por prédio e versão dos dados
+    return _relatorio_cacheado(predio.chave, versao_dados(df_completo), mes_num, mes_nome, ano_ref, tuple(lista_unis_config), df_completo)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _fluxo_cacheado(chave_predio, versao, freq, max_pontos, _df):
+    return reduzir_pontos(serie_fluxo_caixa(_df, obter_predio(chave_predio), freq), max_pontos)
+
+def obter_fluxo_caixa(df_completo, predio, freq="MS", max_pontos=400):
+    # Série já reduzida para o gráfico, calculada uma vez por prédio/versão dos dados/frequência
+    return _fluxo_cacheado(predio.chave, versao_dados(df_completo), freq, max_pontos, df_completo)
+
+def renderizar(modelo, formato):
+    funcao, _, _ = RENDERIZADORES[formato]
+    return funcao(modelo)
+
+# --- PDF (Lógica Mantida, salva em pasta temporária na nuvem) ---
+def gerar_relatorio_prestacao(df_completo, mes_num, mes_nome, ano_ref, lista_unis_config, predio):
+    modelo = obter_relatorio(df_completo, mes_num, mes_nome, ano_ref, lista_unis_config, predio)
+
+    pasta_destino = os.path.join(PASTA_RELATORIOS, predio.chave)
+    os.makedirs(pasta_destino, exist_ok=True)
+    caminho_final = os.path.join(pasta_destino, f"{modelo.nome_base}.pdf")
+    with open(caminho_final, "wb") as f:
+        f.write(renderizar_pdf(modelo))
+    return caminho_final
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from dados import _mask_extras_rateio
+
+# --- FLUXO DE CAIXA (série histórica do saldo) ---
+# Mesmas regras do "Saldo em Caixa (Acumulado)": entradas - extras espelhados - saídas,
+# só que calculado para todos os períodos de uma vez, numa única soma acumulada.
+
+FREQUENCIAS = {"Diário": "D", "Mensal": "MS"}
+COLUNAS_FLUXO = ["Entradas", "Saídas", "Extras", "Saldo"]
+
+def serie_fluxo_caixa(df_completo, predio, freq="MS"):
+    if df_completo is None or df_completo.empty:
+        return pd.DataFrame(columns=COLUNAS_FLUXO)
+
+    valor = df_completo["Valor"].astype(float)
+    fluxo = pd.DataFrame({
+        "Entradas": valor.where(df_completo["Tipo"] == "Entrada", 0.0),
+        "Saídas": valor.where(df_completo["Tipo"] == "Saída", 0.0),
+        "Extras": valor.where(_mask_extras_rateio(df_completo, predio), 0.0),
+    })
+    fluxo.index = pd.to_datetime(df_completo["Data"]).values
+
+    serie = fluxo.sort_index().resample(freq).sum()
+    serie["Saldo"] = (serie["Entradas"] - serie["Saídas"] - serie["Extras"]).cumsum()
+    return serie
+
+def reduzir_pontos(serie, max_pontos=400, coluna="Saldo"):
+    # Mantém, em cada faixa, o primeiro ponto, o mínimo, o máximo e o último do saldo:
+    # a linha continua com os mesmos picos e vales, com poucas centenas de pontos.
+    # Entradas/Saídas/Extras de cada ponto mantido passam a somar tudo desde o ponto anterior,
+    # para a variação do saldo entre dois pontos bater com os fluxos mostrados
+    if len(serie) <= max_pontos:
+        return serie
+    n_faixas = max(max_pontos // 4, 1)
+    valores = serie[coluna].reset_index(drop=True)
+    grupos = valores.groupby(valores.index * n_faixas // len(valores))
+    posicoes = (
+        grupos.head(1).index
+        .append([pd.Index(grupos.idxmin()), pd.Index(grupos.idxmax()), grupos.tail(1).index])
+        .unique().sort_values()
+    )
+    reduzida = serie.iloc[posicoes].copy()
+    fluxos = [c for c in ["Entradas", "Saídas", "Extras"] if c in serie.columns]
+    acumulado = serie[fluxos].cumsum().iloc[posicoes]
+    reduzida[fluxos] = acumulado - acumulado.shift(fill_value=0.0)
+    return reduzida
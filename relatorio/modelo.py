@@ -0,0 +1,253 @@
+import pandas as pd
+import re
+from dataclasses import dataclass, field
+
+from dados import _mask_extras_rateio, formatar_real
+
+# --- MODELO DA PRESTAÇÃO DE CONTAS (só números, nenhuma chamada de PDF/tela) ---
+
+@dataclass
+class LinhaValor:
+    descricao: str
+    valor: float
+
+@dataclass
+class SituacaoUnidade:
+    unidade: str
+    valor_pago: float
+    situacao: str  # "integral", "integral_ajustes", "parcial" ou "aberto"
+    falta: float = 0.0
+
+@dataclass
+class BlocoArrecadacao:
+    titulo: str
+    qtd: int
+    agua_pct: float
+    usa_luz_limp: bool
+    agua: float
+    luz: float
+    limpeza: float
+    fundo: float
+    valor_cota: float
+    total_arrecadado: float
+    extras: list = field(default_factory=list)    # LinhaValor, total do grupo
+    ajustes: list = field(default_factory=list)   # LinhaValor, "Unidade: Descrição"
+    unidades: list = field(default_factory=list)  # SituacaoUnidade
+
+    def por_unidade(self, valor):
+        return valor / self.qtd if self.qtd > 0 else 0
+
+    def composicao(self):
+        # Linhas "COMPOSIÇÃO (Rateio + Fundo + Extras)", iguais em todos os formatos
+        def _item(descricao, valor):
+            return LinhaValor(f"{descricao} ({formatar_real(self.por_unidade(valor))} x {self.qtd} unid)", valor)
+        linhas = [_item(f"{int(self.agua_pct*100)}% Água/Esgoto", self.agua)]
+        if self.usa_luz_limp:
+            linhas += [_item("Luz Condomínio", self.luz), _item("Limpeza Prédio", self.limpeza)]
+        if self.fundo > 0:
+            linhas.append(_item("Fundo de Reserva", self.fundo))
+        return linhas
+
+    def extras_por_unidade(self):
+        return [LinhaValor(f"{e.descricao} ({formatar_real(self.por_unidade(e.valor))} x {self.qtd} unid)", e.valor) for e in self.extras]
+
+@dataclass
+class RelatorioPrestacao:
+    nome_predio: str
+    titulo: str
+    nome_base: str
+    data_inicio: pd.Timestamp
+    data_fim: pd.Timestamp
+    # 1. Saídas
+    gastos_agua: float
+    gastos_luz: float
+    gastos_limpeza: float
+    outras_saidas: list       # LinhaValor
+    extras_espelhados: list   # LinhaValor
+    total_extras_espelhados: float
+    total_saidas: float
+    # 4. Outras receitas
+    outras_receitas: list     # LinhaValor
+    total_outras_receitas: float
+    # 2./3. Arrecadação por grupo
+    blocos: list              # BlocoArrecadacao
+    # Resumo de caixa
+    saldo_anterior: float
+    entradas_periodo: float
+    saldo_final: float
+    # Número do Dashboard (mesmas regras do "Saldo em Caixa (Acumulado)")
+    saldo_acumulado: float
+
+def texto_situacao(situacao_unidade):
+    # (texto, cor RGB) da coluna "SITUAÇÃO / OBS"
+    if situacao_unidade.situacao == "integral":
+        return "Pagamento Integral", (0, 100, 0)
+    if situacao_unidade.situacao == "integral_ajustes":
+        return "Pagamento Integral (+ Ajustes)", (0, 0, 150)
+    if situacao_unidade.situacao == "parcial":
+        return f"Parcial (Falta {formatar_real(situacao_unidade.falta)})", (200, 100, 0)
+    return "EM ABERTO", (180, 0, 0)
+
+def periodo_corte(mes_num, ano_ref):
+    # Devolve [inicio, fim) do período escolhido
+    if ano_ref == "Todos":
+        return pd.Timestamp.min, pd.Timestamp.max
+    if mes_num == 13:
+        inicio = pd.Timestamp(year=ano_ref, month=1, day=1)
+        return inicio, inicio + pd.DateOffset(years=1)
+    inicio = pd.Timestamp(year=ano_ref, month=mes_num, day=1)
+    return inicio, inicio + pd.DateOffset(months=1)
+
+def _nome_extra(descricao):
+    return re.sub(r"[\[\]']", "", str(descricao)).replace("Extra: ", "").strip().split("(")[0].strip()
+
+def _bloco_arrecadacao(df_mes, grupo_da_linha, titulo, grupo, qtd, lista_unidades_grupo, gastos_agua, gastos_luz, gastos_limp):
+    df_u = df_mes[(df_mes["Tipo"]=="Entrada") & (grupo_da_linha == grupo.nome)]
+    agua_pct, usa_luz_limp = grupo.agua_pct, grupo.usa_luz_limp
+
+    bloco = BlocoArrecadacao(
+        titulo=titulo, qtd=qtd, agua_pct=agua_pct, usa_luz_limp=usa_luz_limp,
+        agua=gastos_agua * agua_pct,
+        luz=gastos_luz if usa_luz_limp else 0,
+        limpeza=gastos_limp if usa_luz_limp else 0,
+        fundo=df_u[df_u["Categoria"] == "Fundo de Reserva"]["Valor"].sum(),
+        valor_cota=0.0,
+        total_arrecadado=df_u["Valor"].sum(),
+    )
+
+    df_extras = df_u[~df_u["Categoria"].str.contains("Rateio|Fundo|Ajuste|Saldo")]
+    if not df_extras.empty:
+        for desc, val in df_extras.groupby("Descrição")["Valor"].sum().items():
+            bloco.extras.append(LinhaValor(_nome_extra(desc), val))
+    total_extras_recebido = df_extras["Valor"].sum()
+
+    df_ajustes_all = df_u[df_u["Categoria"].str.contains("Ajuste")]
+    for _, row in df_ajustes_all.iterrows():
+        if abs(row['Valor']) > 0.01:
+            bloco.ajustes.append(LinhaValor(f"{row['Unidade']}: {row['Descrição']}", row['Valor']))
+
+    bloco.valor_cota = (
+        bloco.por_unidade(bloco.agua) + bloco.por_unidade(bloco.luz) + bloco.por_unidade(bloco.limpeza)
+        + bloco.por_unidade(bloco.fundo) + bloco.por_unidade(total_extras_recebido)
+    )
+
+    pago_por_unidade = df_u.groupby("Unidade")["Valor"].sum()
+    for unidade_nome in lista_unidades_grupo:
+        entradas_uni = pago_por_unidade.get(unidade_nome, 0.0)
+        if entradas_uni >= (bloco.valor_cota - 0.10):
+            situacao = "integral_ajustes" if entradas_uni > (bloco.valor_cota + 1.00) else "integral"
+            bloco.unidades.append(SituacaoUnidade(unidade_nome, entradas_uni, situacao))
+        elif entradas_uni > 0:
+            bloco.unidades.append(SituacaoUnidade(unidade_nome, entradas_uni, "parcial", bloco.valor_cota - entradas_uni))
+        else:
+            bloco.unidades.append(SituacaoUnidade(unidade_nome, entradas_uni, "aberto"))
+
+    return bloco
+
+def construir_relatorio(df_completo, mes_num, mes_nome, ano_ref, lista_unis_config, predio):
+    df_completo = df_completo.assign(Data=pd.to_datetime(df_completo["Data"]))
+    data_inicio_corte, data_fim_corte = periodo_corte(mes_num, ano_ref)
+
+    if ano_ref == "Todos":
+        df_mes = df_completo
+        titulo = "Relatório Geral - Todo o Período"
+        nome_base = "Relatorio_Geral_Todos"
+    else:
+        df_mes = df_completo[(df_completo["Data"] >= data_inicio_corte) & (df_completo["Data"] < data_fim_corte)]
+        if mes_num == 13:
+            titulo = f"Relatório Anual - {ano_ref}"
+            nome_base = f"Relatorio_Anual_{ano_ref}"
+        else:
+            titulo = f"Relatório de Prestação de Contas - {mes_nome}/{ano_ref}"
+            nome_base = f"Relatorio_{mes_nome}_{ano_ref}"
+
+    eh_saldo_inicial = df_completo["Categoria"].str.contains("Saldo Inicial", case=False, na=False)
+    df_ant_norm = df_completo[(df_completo["Data"] < data_inicio_corte) & ~eh_saldo_inicial]
+
+    ant_entradas = df_ant_norm[df_ant_norm["Tipo"]=="Entrada"]["Valor"].sum()
+    ant_saidas = df_ant_norm[df_ant_norm["Tipo"]=="Saída"]["Valor"].sum()
+    ant_extras = df_ant_norm[_mask_extras_rateio(df_ant_norm, predio)]["Valor"].sum()
+
+    saldo_op_ant = ant_entradas - ant_saidas - ant_extras
+    val_inicial = df_completo[eh_saldo_inicial]["Valor"].sum()
+    saldo_anterior = saldo_op_ant + val_inicial
+
+    # 1. SAÍDAS
+    df_saidas_mes = df_mes[df_mes["Tipo"]=="Saída"]
+
+    mask_agua = df_saidas_mes["Categoria"].str.contains("Água", case=False) & ~df_saidas_mes["Categoria"].str.contains("Cx|Caixa|Conserto", case=False)
+    mask_luz = df_saidas_mes["Categoria"].str.contains("Luz", case=False) & ~df_saidas_mes["Categoria"].str.contains("Conserto", case=False)
+    mask_limpeza = df_saidas_mes["Categoria"].str.contains("Limpeza", case=False) & ~df_saidas_mes["Categoria"].str.contains("Cx|Caixa|Conserto|Manutenção", case=False)
+
+    gastos_agua = df_saidas_mes[mask_agua]["Valor"].sum()
+    gastos_luz = df_saidas_mes[mask_luz]["Valor"].sum()
+    gastos_limp = df_saidas_mes[mask_limpeza]["Valor"].sum()
+
+    df_outros_manuais = df_saidas_mes[~(mask_agua | mask_luz | mask_limpeza)]
+    outras_saidas = [LinhaValor(str(desc), val) for desc, val in df_outros_manuais.groupby("Descrição")["Valor"].sum().items()]
+
+    mask_extras_mes = _mask_extras_rateio(df_mes, predio)
+    df_extras_arrecadados = df_mes[mask_extras_mes]
+    extras_espelhados = [LinhaValor(_nome_extra(desc), val) for desc, val in df_extras_arrecadados.groupby("Descrição")["Valor"].sum().items()]
+    total_extras_espelhados = sum(l.valor for l in extras_espelhados)
+
+    total_saidas = gastos_agua + gastos_luz + gastos_limp + df_outros_manuais["Valor"].sum() + total_extras_espelhados
+
+    # 4. OUTRAS RECEITAS (ENTRADAS AVULSAS)
+    eh_entrada_mes = df_mes["Tipo"] == "Entrada"
+    eh_saldo_inicial_mes = df_mes["Categoria"].astype(str).str.contains("Saldo Inicial", case=False, na=False)
+    mask_outras_receitas = (
+        eh_entrada_mes
+        & (df_mes["Valor"] > 0.01)
+        & (~eh_saldo_inicial_mes)
+        & (~df_mes["Categoria"].astype(str).str.contains("Rateio|Fundo", case=False, regex=True, na=False))
+        & (~mask_extras_mes)
+    )
+    df_outras_receitas = df_mes[mask_outras_receitas]
+    outras_receitas = [
+        LinhaValor(str(desc).strip() if not pd.isna(desc) else "", val)
+        for desc, val in df_outras_receitas.groupby("Descrição")["Valor"].sum().items()
+    ]
+
+    # 2., 3., ... Um bloco por grupo de unidades do prédio (ex: Salas 35% da água, Aptos 65% + Luz/Limpeza)
+    # Cada lançamento cai no mesmo grupo que a Calculadora usa (predio.grupo_da_unidade)
+    grupos_unidades = {u: getattr(predio.grupo_da_unidade(u), "nome", None) for u in df_mes["Unidade"].unique()}
+    grupo_da_linha = df_mes["Unidade"].map(grupos_unidades)
+    blocos = [
+        _bloco_arrecadacao(
+            df_mes, grupo_da_linha, f"{i + 2}. ARRECADAÇÃO: {grupo.titulo}", grupo,
+            predio.qtd_grupo(lista_unis_config, grupo), predio.unidades_do_grupo(lista_unis_config, grupo),
+            gastos_agua, gastos_luz, gastos_limp,
+        )
+        for i, grupo in enumerate(predio.grupos)
+    ]
+
+    entradas_periodo = df_mes[eh_entrada_mes & ~eh_saldo_inicial_mes]["Valor"].sum()
+
+    # Dashboard: saldo acumulado até o fim do período
+    df_acum = df_completo[df_completo["Data"] < data_fim_corte] if ano_ref != "Todos" else df_completo
+    saldo_acumulado = (
+        df_acum[df_acum["Tipo"]=="Entrada"]["Valor"].sum()
+        - df_acum[_mask_extras_rateio(df_acum, predio)]["Valor"].sum()
+        - df_acum[df_acum["Tipo"]=="Saída"]["Valor"].sum()
+    )
+
+    return RelatorioPrestacao(
+        nome_predio=predio.nome, titulo=titulo, nome_base=nome_base, data_inicio=data_inicio_corte, data_fim=data_fim_corte,
+        gastos_agua=gastos_agua, gastos_luz=gastos_luz, gastos_limpeza=gastos_limp,
+        outras_saidas=outras_saidas, extras_espelhados=extras_espelhados,
+        total_extras_espelhados=total_extras_espelhados, total_saidas=total_saidas,
+        outras_receitas=outras_receitas, total_outras_receitas=df_outras_receitas["Valor"].sum(),
+        blocos=blocos,
+        saldo_anterior=saldo_anterior, entradas_periodo=entradas_periodo,
+        saldo_final=saldo_anterior + entradas_periodo - total_saidas,
+        saldo_acumulado=saldo_acumulado,
+    )
+
+def metricas_periodo(df_periodo, predio):
+    # Cartões "Entradas/Saídas (Período)" e "Res. Período" do Dashboard: usam o mesmo recorte da tabela
+    # (ano, mês e tipo escolhidos), inclusive "Todos" os anos com um mês só, que não é um período contínuo
+    entradas = df_periodo[df_periodo["Tipo"]=="Entrada"]["Valor"].sum()
+    saidas = df_periodo[df_periodo["Tipo"]=="Saída"]["Valor"].sum()
+    extras = df_periodo[_mask_extras_rateio(df_periodo, predio)]["Valor"].sum()
+    return entradas, saidas, entradas - saidas - extras
@@ -0,0 +1,39 @@
+import csv
+import io
+
+from relatorio.modelo import texto_situacao
+
+# --- RENDERIZADOR CSV (Seção; Descrição; Valor; Situação) ---
+
+def renderizar_csv(modelo):
+    buffer = io.StringIO()
+    w = csv.writer(buffer, delimiter=";")
+    w.writerow(["Seção", "Descrição", "Valor", "Situação"])
+
+    saidas = "Saídas"
+    w.writerow([saidas, "Água + Esgoto", f"{modelo.gastos_agua:.2f}"])
+    w.writerow([saidas, "Luz (Área Comum)", f"{modelo.gastos_luz:.2f}"])
+    w.writerow([saidas, "Limpeza Prédio", f"{modelo.gastos_limpeza:.2f}"])
+    for l in modelo.outras_saidas: w.writerow([saidas, l.descricao, f"{l.valor:.2f}"])
+    for l in modelo.extras_espelhados: w.writerow([saidas, f"{l.descricao} (Extra)", f"{l.valor:.2f}"])
+    w.writerow([saidas, "TOTAL SAÍDAS", f"{modelo.total_saidas:.2f}"])
+
+    for bloco in modelo.blocos:
+        w.writerow([bloco.titulo, "Valor por Unidade", f"{bloco.valor_cota:.2f}"])
+        for l in bloco.composicao(): w.writerow([f"{bloco.titulo} - Composição", l.descricao, f"{l.valor:.2f}"])
+        for l in bloco.extras_por_unidade(): w.writerow([f"{bloco.titulo} - Despesas Extras", l.descricao, f"{l.valor:.2f}"])
+        for l in bloco.ajustes: w.writerow([f"{bloco.titulo} - Ajustes/Recuperações", l.descricao, f"{l.valor:.2f}"])
+        for sit in bloco.unidades: w.writerow([bloco.titulo, sit.unidade, f"{sit.valor_pago:.2f}", texto_situacao(sit)[0]])
+        w.writerow([bloco.titulo, "TOTAL ARRECADADO GRUPO", f"{bloco.total_arrecadado:.2f}"])
+
+    if modelo.outras_receitas:
+        for l in modelo.outras_receitas: w.writerow(["Outras Receitas", l.descricao, f"{l.valor:.2f}"])
+        w.writerow(["Outras Receitas", "TOTAL OUTRAS RECEITAS", f"{modelo.total_outras_receitas:.2f}"])
+
+    resumo = "Resumo de Caixa"
+    w.writerow([resumo, "SALDO ANTERIOR", f"{modelo.saldo_anterior:.2f}"])
+    w.writerow([resumo, "ENTRADAS TOTAIS", f"{modelo.entradas_periodo:.2f}"])
+    w.writerow([resumo, "SAÍDAS", f"{modelo.total_saidas:.2f}"])
+    w.writerow([resumo, "SALDO ATUAL EM CAIXA", f"{modelo.saldo_final:.2f}"])
+    # BOM para o Excel abrir os acentos corretamente
+    return buffer.getvalue().encode("utf-8-sig")
@@ -0,0 +1,65 @@
+import html
+
+from dados import formatar_real
+from relatorio.modelo import texto_situacao
+
+# --- RENDERIZADOR HTML (pré-visualização no app, sem gerar PDF) ---
+
+def _linha(descricao, valor, estilo=""):
+    return f"<tr style='{estilo}'><td>{html.escape(str(descricao))}</td><td style='text-align:right'>{formatar_real(valor)}</td></tr>"
+
+def _secao(titulo):
+    return f"<tr style='background:#f0f0f0;font-weight:bold'><td colspan='2'>{html.escape(titulo)}</td></tr>"
+
+def _subtitulo(titulo):
+    return f"<tr style='font-weight:bold;font-size:0.85em'><td colspan='2'>{html.escape(titulo)}</td></tr>"
+
+def renderizar_html(modelo):
+    partes = [
+        "<div style='font-family:sans-serif;font-size:0.9em'>",
+        f"<h4 style='text-align:center;margin:0'>{html.escape(modelo.nome_predio.upper())}</h4>",
+        f"<p style='text-align:center'>{html.escape(modelo.titulo)}</p>",
+        "<table style='width:100%;border-collapse:collapse'>",
+        _secao("1. DESPESAS REALIZADAS (SAÍDAS DO CAIXA)"),
+        _linha("Água + Esgoto", modelo.gastos_agua),
+        _linha("Luz (Área Comum)", modelo.gastos_luz),
+        _linha("Limpeza Prédio", modelo.gastos_limpeza),
+    ]
+    partes += [_linha(l.descricao, l.valor) for l in modelo.outras_saidas]
+    partes += [_linha(f"{l.descricao} (Extra)", l.valor) for l in modelo.extras_espelhados]
+    partes.append(_linha("TOTAL SAÍDAS:", modelo.total_saidas, "font-weight:bold"))
+
+    for bloco in modelo.blocos:
+        partes.append(_secao(f"{bloco.titulo} — Valor por Unidade: {formatar_real(bloco.valor_cota)}"))
+        partes.append(_subtitulo("COMPOSIÇÃO (Rateio + Fundo + Extras)"))
+        partes += [_linha(l.descricao, l.valor) for l in bloco.composicao()]
+        if bloco.extras:
+            partes.append(_subtitulo("DESPESAS EXTRAS"))
+            partes += [_linha(l.descricao, l.valor) for l in bloco.extras_por_unidade()]
+        if bloco.ajustes:
+            partes.append(_subtitulo("AJUSTES / RECUPERAÇÕES"))
+            partes += [_linha(l.descricao, l.valor) for l in bloco.ajustes]
+        partes.append(_subtitulo("UNIDADE — SITUAÇÃO / OBS"))
+        for sit in bloco.unidades:
+            status_txt, cor = texto_situacao(sit)
+            partes.append(
+                f"<tr><td>{html.escape(sit.unidade)} <span style='color:rgb{cor}'>({html.escape(status_txt)})</span></td>"
+                f"<td style='text-align:right'>{formatar_real(sit.valor_pago)}</td></tr>"
+            )
+        partes.append(_linha("TOTAL ARRECADADO GRUPO:", bloco.total_arrecadado, "font-weight:bold"))
+
+    if modelo.outras_receitas:
+        partes.append(_secao(f"{len(modelo.blocos) + 2}. OUTRAS RECEITAS (ENTRADAS AVULSAS)"))
+        partes += [_linha(l.descricao, l.valor) for l in modelo.outras_receitas]
+        partes.append(_linha("TOTAL OUTRAS RECEITAS:", modelo.total_outras_receitas, "font-weight:bold"))
+
+    cor_saldo = "#0000c8" if modelo.saldo_final >= 0 else "#ff0000"
+    partes += [
+        _secao("RESUMO DE CAIXA (FLUXO)"),
+        _linha("SALDO ANTERIOR", modelo.saldo_anterior, "color:#646464"),
+        _linha("(+) ENTRADAS TOTAIS", modelo.entradas_periodo, "color:#006400"),
+        _linha("(-) SAÍDAS", modelo.total_saidas, "color:#b40000"),
+        _linha("(=) SALDO ATUAL EM CAIXA", modelo.saldo_final, f"color:{cor_saldo};font-weight:bold"),
+        "</table></div>",
+    ]
+    return "\n".join(partes)
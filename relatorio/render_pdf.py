@@ -0,0 +1,122 @@
+from dados import formatar_real
+from relatorio.modelo import texto_situacao
+
+# --- RENDERIZADOR PDF (FPDF) ---
+
+def _bloco_pdf(pdf, bloco):
+    pdf.set_fill_color(230, 230, 230)
+    pdf.set_font("Arial", 'B', size=10)
+    txt_valor_cota = f"Valor por Unidade: {formatar_real(bloco.valor_cota)}"
+    pdf.cell(130, 6, bloco.titulo, 1, 0, 'L', 1)
+    pdf.set_text_color(0, 0, 150)
+    pdf.cell(60, 6, txt_valor_cota, 1, 1, 'R', 1)
+    pdf.set_text_color(0, 0, 0)
+
+    pdf.set_font("Arial", 'B', size=8)
+    pdf.cell(190, 5, "COMPOSIÇÃO (Rateio + Fundo + Extras)", 0, 1, 'L')
+    pdf.set_font("Arial", size=8)
+
+    for linha in bloco.composicao():
+        pdf.cell(140, 4, linha.descricao, "B"); pdf.cell(50, 4, formatar_real(linha.valor), "B", 1, 'R')
+
+    if bloco.extras:
+        pdf.ln(1); pdf.set_font("Arial", 'B', size=8)
+        pdf.cell(190, 5, "DESPESAS EXTRAS", 0, 1, 'L'); pdf.set_font("Arial", size=8)
+        for extra in bloco.extras_por_unidade():
+            pdf.cell(140, 4, extra.descricao, "B"); pdf.cell(50, 4, formatar_real(extra.valor), "B", 1, 'R')
+
+    if bloco.ajustes:
+        pdf.ln(1); pdf.set_font("Arial", 'B', size=8)
+        pdf.cell(190, 5, "AJUSTES / RECUPERAÇÕES", 0, 1, 'L'); pdf.set_font("Arial", size=8)
+        for ajuste in bloco.ajustes:
+            pdf.cell(140, 4, ajuste.descricao, "B"); pdf.cell(50, 4, formatar_real(ajuste.valor), "B", 1, 'R')
+
+    pdf.ln(2)
+
+    pdf.set_font("Arial", 'B', size=8)
+    pdf.set_fill_color(220, 220, 220)
+    pdf.cell(40, 5, "UNIDADE", 1, 0, 'C', 1)
+    pdf.cell(40, 5, "VALOR PAGO", 1, 0, 'C', 1)
+    pdf.cell(110, 5, "SITUAÇÃO / OBS", 1, 1, 'C', 1)
+    pdf.set_font("Arial", size=8)
+
+    for sit in bloco.unidades:
+        status_txt, cor_texto = texto_situacao(sit)
+        pdf.set_text_color(0, 0, 0)
+        pdf.cell(40, 5, f"  {sit.unidade}", 1)
+        pdf.cell(40, 5, formatar_real(sit.valor_pago), 1, 0, 'R')
+        pdf.set_text_color(*cor_texto)
+        pdf.cell(110, 5, f"  {status_txt}", 1, 1)
+
+    pdf.set_text_color(0, 0, 0)
+    pdf.ln(1)
+    pdf.set_font("Arial", 'B', size=9)
+    pdf.cell(140, 6, "TOTAL ARRECADADO GRUPO:", 0, 0, 'R'); pdf.cell(50, 6, formatar_real(bloco.total_arrecadado), 1, 1, 'R')
+    pdf.ln(3)
+
+def renderizar_pdf(modelo):
+    # Import tardio: o FPDF só é carregado quando um PDF é de fato gerado
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', size=14)
+    pdf.cell(190, 8, txt=modelo.nome_predio.upper(), ln=1, align="C")
+    pdf.set_font("Arial", size=11)
+    pdf.cell(190, 6, txt=modelo.titulo, ln=1, align="C")
+    pdf.line(10, 26, 200, 26)
+    pdf.ln(4)
+
+    # 1. SAÍDAS
+    pdf.set_font("Arial", 'B', size=10)
+    pdf.set_fill_color(240, 240, 240)
+    pdf.cell(190, 6, "1. DESPESAS REALIZADAS (SAÍDAS DO CAIXA)", 1, 1, 'L', 1)
+
+    pdf.set_font("Arial", size=9)
+    pdf.cell(140, 5, "Água + Esgoto", 1); pdf.cell(50, 5, formatar_real(modelo.gastos_agua), 1, 1, 'R')
+    pdf.cell(140, 5, "Luz (Área Comum)", 1); pdf.cell(50, 5, formatar_real(modelo.gastos_luz), 1, 1, 'R')
+    pdf.cell(140, 5, "Limpeza Prédio", 1); pdf.cell(50, 5, formatar_real(modelo.gastos_limpeza), 1, 1, 'R')
+
+    for linha in modelo.outras_saidas:
+        pdf.cell(140, 5, linha.descricao, 1); pdf.cell(50, 5, formatar_real(linha.valor), 1, 1, 'R')
+
+    for linha in modelo.extras_espelhados:
+        pdf.cell(140, 5, f"{linha.descricao} (Extra)", 1); pdf.cell(50, 5, formatar_real(linha.valor), 1, 1, 'R')
+
+    pdf.set_font("Arial", 'B', size=9)
+    pdf.cell(140, 5, "TOTAL SAÍDAS:", 1); pdf.cell(50, 5, formatar_real(modelo.total_saidas), 1, 1, 'R')
+    pdf.ln(3)
+
+    # 4. OUTRAS RECEITAS (ENTRADAS AVULSAS)
+    if modelo.outras_receitas:
+        pdf.set_font("Arial", 'B', size=10)
+        pdf.set_fill_color(240, 240, 240)
+        pdf.cell(190, 6, f"{len(modelo.blocos) + 2}. OUTRAS RECEITAS (ENTRADAS AVULSAS)", 1, 1, 'L', 1)
+        pdf.set_font("Arial", size=9)
+
+        for linha in modelo.outras_receitas:
+            pdf.cell(140, 5, linha.descricao, 1)
+            pdf.cell(50, 5, formatar_real(linha.valor), 1, 1, 'R')
+
+        pdf.set_font("Arial", 'B', size=9)
+        pdf.cell(140, 5, "TOTAL OUTRAS RECEITAS:", 1)
+        pdf.cell(50, 5, formatar_real(modelo.total_outras_receitas), 1, 1, 'R')
+        pdf.ln(3)
+
+    for bloco in modelo.blocos:
+        _bloco_pdf(pdf, bloco)
+
+    pdf.set_font("Arial", 'B', size=11)
+    pdf.cell(190, 8, "RESUMO DE CAIXA (FLUXO)", 0, 1, 'C')
+    pdf.set_font("Arial", 'B', size=9)
+    pdf.cell(100, 6, "DESCRIÇÃO", 1, 0, 'C', 1); pdf.cell(90, 6, "VALOR", 1, 1, 'C', 1)
+
+    pdf.set_text_color(100, 100, 100); pdf.cell(100, 6, "SALDO ANTERIOR", 1); pdf.cell(90, 6, formatar_real(modelo.saldo_anterior), 1, 1, 'R')
+    pdf.set_text_color(0, 100, 0); pdf.cell(100, 6, "(+) ENTRADAS TOTAIS", 1); pdf.cell(90, 6, formatar_real(modelo.entradas_periodo), 1, 1, 'R')
+    pdf.set_text_color(180, 0, 0); pdf.cell(100, 6, "(-) SAÍDAS", 1); pdf.cell(90, 6, formatar_real(modelo.total_saidas), 1, 1, 'R')
+
+    if modelo.saldo_final >= 0: pdf.set_text_color(0, 0, 200)
+    else: pdf.set_text_color(255, 0, 0)
+    pdf.cell(100, 6, "(=) SALDO ATUAL EM CAIXA", 1); pdf.cell(90, 6, formatar_real(modelo.saldo_final), 1, 1, 'R')
+    pdf.set_text_color(0, 0, 0)
+
+    return pdf.output(dest="S").encode("latin-1")
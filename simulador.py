@@ -0,0 +1,33 @@
+import pandas as pd
+
+# --- SIMULADOR DE CENÁRIOS (Calculadora de Rateio) ---
+# Todas as combinações de entradas viram linhas de uma tabela, e as cotas de cada grupo
+# são calculadas coluna a coluna (vetorizado), sem laço por cenário e sem acessar a planilha.
+
+MAX_CENARIOS = 200_000
+
+def grade_cenarios(fundos, aguas, luzes, limpezas, extras, alvos):
+    indice = pd.MultiIndex.from_product(
+        [fundos, aguas, luzes, limpezas, extras, alvos],
+        names=["Fundo", "Água", "Luz", "Limpeza", "Extra Total", "Ratear Para"],
+    )
+    return indice.to_frame(index=False)
+
+def simular_cenarios(predio, lista_unis, cenarios):
+    # Mesma regra da "Calcular e Pré-Visualizar", para cada linha de `cenarios` ao mesmo tempo
+    res = cenarios.copy()
+    alvo = res["Ratear Para"].astype(str)
+    extra_todos = res["Extra Total"].where(alvo.str.contains("Todos"), 0.0)
+    divisor_todos = predio.divisor_alvo(lista_unis, "Todos")
+
+    res["Total Arrecadado"] = 0.0
+    for grupo in predio.grupos:
+        qtd = predio.qtd_grupo(lista_unis, grupo)
+        n_unidades = len(predio.unidades_do_grupo(lista_unis, grupo))
+        luz_limp = (res["Luz"] + res["Limpeza"]) if grupo.usa_luz_limp else 0.0
+        rateio = (res["Água"] * grupo.agua_pct + luz_limp) / qtd
+        extra = extra_todos / divisor_todos + res["Extra Total"].where(alvo == grupo.alvo, 0.0) / qtd
+        cota = rateio + res["Fundo"] + extra
+        res[f"Cota {grupo.titulo.title()}"] = cota
+        res["Total Arrecadado"] += cota * n_unidades
+    return res
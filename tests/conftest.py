@@ -0,0 +1,26 @@
+import os
+import sys
+
+from gspread.exceptions import WorksheetNotFound
+
+# Os módulos do app ficam na raiz do repositório (o Streamlit roda appOnline.py de lá)
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+class PlanilhaFalsa:
+    # Mesma interface de leitura/gravação do GSheetsConnection, com as abas em memória
+    def __init__(self, abas):
+        self.abas = abas
+        self.gravacoes = []
+
+    def read(self, spreadsheet, worksheet, ttl=None):
+        if worksheet not in self.abas:
+            raise WorksheetNotFound(worksheet)
+        return self.abas[worksheet].copy()
+
+    def update(self, spreadsheet, data, worksheet):
+        if worksheet not in self.abas:
+            raise WorksheetNotFound(worksheet)
+        self.gravacoes.append(worksheet)
+        self.abas[worksheet] = data.copy()
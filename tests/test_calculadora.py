@@ -0,0 +1,33 @@
+import json
+import subprocess
+import sys
+
+from conftest import RAIZ
+
+# Processo separado: o sys.modules dos outros testes não pode esconder um import do Plotly
+SCRIPT = r"""
+import json, sys
+from streamlit.testing.v1 import AppTest
+
+PAGINA = '''
+from paginas.calculadora import renderizar
+from predios import SAN_RAFAEL
+renderizar(SAN_RAFAEL, list(SAN_RAFAEL.categorias_padrao), list(SAN_RAFAEL.unidades_padrao))
+'''
+
+at = AppTest.from_string(PAGINA).run()
+fechado = {"plotly": "plotly.express" in sys.modules, "tabelas": len(at.dataframe)}
+at.toggle(key="sim_ativo").set_value(True).run()
+ativo = {"plotly": "plotly.express" in sys.modules, "tabelas": len(at.dataframe)}
+print(json.dumps({"fechado": fechado, "ativo": ativo, "erros": [e.value for e in at.exception]}))
+"""
+
+def test_simulador_so_roda_depois_de_ativado():
+    saida = subprocess.run([sys.executable, "-c", SCRIPT], cwd=RAIZ, capture_output=True, text=True)
+    assert saida.returncode == 0, saida.stderr[-2000:]
+    resultado = json.loads(saida.stdout.strip().splitlines()[-1])
+
+    assert resultado["erros"] == []
+    assert resultado["fechado"]["plotly"] is False
+    # Ativado: a tabela de cenários aparece (a outra é a tabela de extras da Calculadora) e o gráfico carrega o Plotly
+    assert resultado["ativo"] == {"plotly": True, "tabelas": resultado["fechado"]["tabelas"] + 1}
@@ -0,0 +1,156 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+import streamlit as st
+
+import dados
+from dados import COLUNA_VERSAO, WORKSHEET_CONTROLE, WORKSHEET_DADOS
+from conftest import PlanilhaFalsa
+from predios import SAN_RAFAEL
+
+def _linha(id_, valor, versao=1):
+    return {"ID": id_, "Data": "2024-03-05", "Tipo": "Entrada", "Categoria": "Rateio Despesas (Água/Luz)",
+            "Unidade": "Apto 101", "Descrição": "Rateio", "Valor": valor, "Status": "Ok", COLUNA_VERSAO: versao}
+
+@pytest.fixture
+def planilha(monkeypatch):
+    conn = PlanilhaFalsa({
+        WORKSHEET_DADOS: pd.DataFrame([_linha("R", 100.0), _linha("S", 50.0)]),
+        WORKSHEET_CONTROLE: pd.DataFrame({COLUNA_VERSAO: [1]}),
+    })
+    monkeypatch.setattr(dados, "get_conexao", lambda: conn)
+    dados._espelho_planilha.clear()
+    st.session_state.clear()
+    yield conn
+    st.session_state.clear()
+
+def _remoto(conn):
+    return conn.abas[WORKSHEET_DADOS].set_index("ID")
+
+def _editar(df, id_, valor):
+    df = df.copy()
+    df.loc[df["ID"] == id_, "Valor"] = valor
+    return df
+
+def test_base_da_sessao_fica_fixa_entre_reruns(planilha):
+    base = dados.dados_da_sessao(SAN_RAFAEL)
+    planilha.abas[WORKSHEET_DADOS] = pd.DataFrame([_linha("R", 999.0, 2)])
+    assert dados.dados_da_sessao(SAN_RAFAEL)["Valor"].tolist() == base["Valor"].tolist()
+
+    dados.recarregar_dados(SAN_RAFAEL)
+    assert dados.dados_da_sessao(SAN_RAFAEL)["Valor"].tolist() == [999.0]
+
+def test_grava_so_a_diferenca_e_sobe_versoes(planilha):
+    df = dados.dados_da_sessao(SAN_RAFAEL)
+    df = _editar(df, "R", 120.0)
+    df = pd.concat([df[df["ID"] != "S"], pd.DataFrame([_linha("T", 10.0)]).drop(columns=COLUNA_VERSAO)], ignore_index=True)
+
+    assert dados.salvar_dados(df, SAN_RAFAEL) == []
+    remoto = _remoto(planilha)
+    assert sorted(remoto.index) == ["R", "T"]
+    assert remoto.loc["R", "Valor"] == 120.0 and remoto.loc["R", COLUNA_VERSAO] == 2
+    assert remoto.loc["T", COLUNA_VERSAO] == 1
+    assert planilha.abas[WORKSHEET_CONTROLE][COLUNA_VERSAO].iloc[0] == 2
+    # Carimbo gravado antes do livro
+    assert planilha.gravacoes == [WORKSHEET_CONTROLE, WORKSHEET_DADOS]
+
+def test_base_velha_rejeita_linha_alterada_por_outra_pessoa(planilha):
+    # A abre a tela; B grava R; A grava R -> rejeitado, a versão de B fica
+    base_a = dados.dados_da_sessao(SAN_RAFAEL)
+    dados.salvar_alteracoes(SAN_RAFAEL, alterados=_editar(base_a, "R", 200.0)[lambda d: d["ID"] == "R"], versoes_base={"R": 1})
+    st.session_state[dados._chave_base(SAN_RAFAEL)] = base_a
+
+    assert dados.salvar_dados(_editar(base_a, "R", 300.0), SAN_RAFAEL) == ["R"]
+    assert _remoto(planilha).loc["R", "Valor"] == 200.0
+    # A base da sessão passa a mostrar o valor de B
+    assert dados.dados_da_sessao(SAN_RAFAEL).set_index("ID").loc["R", "Valor"] == 200.0
+
+def test_base_velha_nao_bloqueia_linhas_sem_conflito(planilha):
+    base_a = dados.dados_da_sessao(SAN_RAFAEL)
+    dados.salvar_alteracoes(SAN_RAFAEL, alterados=_editar(base_a, "R", 200.0)[lambda d: d["ID"] == "R"], versoes_base={"R": 1})
+    st.session_state[dados._chave_base(SAN_RAFAEL)] = base_a
+
+    # A edita só S e exclui nada: grava, e a mudança de B em R é preservada
+    assert dados.salvar_dados(_editar(base_a, "S", 55.0), SAN_RAFAEL) == []
+    remoto = _remoto(planilha)
+    assert remoto.loc["R", "Valor"] == 200.0 and remoto.loc["S", "Valor"] == 55.0
+
+def test_aviso_de_conflito_sobrevive_ao_rerun(planilha):
+    base_a = dados.dados_da_sessao(SAN_RAFAEL)
+    dados.salvar_alteracoes(SAN_RAFAEL, alterados=_editar(base_a, "R", 200.0)[lambda d: d["ID"] == "R"], versoes_base={"R": 1})
+    assert dados.aviso_conflito(SAN_RAFAEL) is None
+    st.session_state[dados._chave_base(SAN_RAFAEL)] = base_a
+
+    dados.salvar_dados(_editar(base_a, "R", 300.0), SAN_RAFAEL)
+    assert "1 lançamento(s)" in dados.aviso_conflito(SAN_RAFAEL)
+    assert dados.aviso_conflito(SAN_RAFAEL) is None  # mostrado uma vez só
+
+def test_base_desatualizada_quando_outra_pessoa_grava(planilha):
+    base_a = dados.dados_da_sessao(SAN_RAFAEL)
+    assert not dados.base_desatualizada(base_a, dados.carregar_dados(SAN_RAFAEL))
+    dados.salvar_alteracoes(SAN_RAFAEL, alterados=_editar(base_a, "S", 70.0)[lambda d: d["ID"] == "S"], versoes_base={"S": 1})
+    assert dados.base_desatualizada(base_a, dados.carregar_dados(SAN_RAFAEL))
+
+def test_data_do_formulario_vira_datetime_na_base(planilha):
+    # st.date_input devolve datetime.date; a base e o espelho precisam continuar com .dt
+    novo = pd.DataFrame([{**_linha("T", 10.0), "Data": date(2024, 4, 1)}]).drop(columns=COLUNA_VERSAO)
+    dados.dados_da_sessao(SAN_RAFAEL)
+    dados.acrescentar_dados(novo, SAN_RAFAEL)
+
+    base = dados.dados_da_sessao(SAN_RAFAEL)
+    assert base.set_index("ID")["Data"].dt.year.to_dict() == {"R": 2024, "S": 2024, "T": 2024}
+    assert pd.api.types.is_datetime64_any_dtype(dados._espelho_planilha(SAN_RAFAEL.chave)["df"]["Data"])
+    assert planilha.abas[WORKSHEET_DADOS].set_index("ID").loc["T", "Data"] == "2024-04-01"
+
+def test_exclusao_de_linha_alterada_por_outra_pessoa_e_rejeitada(planilha):
+    base_a = dados.dados_da_sessao(SAN_RAFAEL)
+    dados.salvar_alteracoes(SAN_RAFAEL, alterados=_editar(base_a, "S", 70.0)[lambda d: d["ID"] == "S"], versoes_base={"S": 1})
+    st.session_state[dados._chave_base(SAN_RAFAEL)] = base_a
+
+    assert dados.salvar_dados(base_a[base_a["ID"] != "S"], SAN_RAFAEL) == ["S"]
+    assert "S" in _remoto(planilha).index
+
+def test_inclusao_nao_precisa_ler_o_livro(planilha):
+    novo = pd.DataFrame([_linha("T", 10.0)]).drop(columns=COLUNA_VERSAO)
+    assert dados.acrescentar_dados(novo, SAN_RAFAEL) == []
+    assert sorted(_remoto(planilha).index) == ["R", "S", "T"]
+
+def test_sem_aba_controle_grava_o_livro(planilha):
+    del planilha.abas[WORKSHEET_CONTROLE]
+    base = dados.dados_da_sessao(SAN_RAFAEL)
+    assert dados.salvar_dados(_editar(base, "R", 120.0), SAN_RAFAEL) == []
+    assert _remoto(planilha).loc["R", "Valor"] == 120.0
+
+def test_falha_ao_gravar_carimbo_nao_toca_no_livro(planilha, monkeypatch):
+    def update_quebrado(spreadsheet, data, worksheet):
+        raise ConnectionError("sem rede")
+    monkeypatch.setattr(planilha, "update", update_quebrado)
+    base = dados.dados_da_sessao(SAN_RAFAEL)
+
+    with pytest.raises(ConnectionError):
+        dados.salvar_dados(_editar(base, "R", 120.0), SAN_RAFAEL)
+    assert _remoto(planilha).loc["R", "Valor"] == 100.0
+    assert dados._espelho_planilha(SAN_RAFAEL.chave)["versao"] is None
+
+def test_config_salva_e_lida_de_novo(planilha):
+    planilha.abas[dados.WORKSHEET_CONFIG] = pd.DataFrame({"Categorias": ["Luz"], "Unidades": ["Apto 101"]})
+    dados._ler_config.clear()
+    assert dados.carregar_config(SAN_RAFAEL)["Unidades"].tolist() == ["Apto 101"]
+
+    dados.salvar_config(pd.DataFrame({"Categorias": ["Luz", ""], "Unidades": ["Apto 101", "Apto 102"]}), SAN_RAFAEL)
+    assert dados.carregar_config(SAN_RAFAEL)["Unidades"].tolist() == ["Apto 101", "Apto 102"]
+
+def test_falha_ao_ler_carimbo_aborta_a_gravacao(planilha, monkeypatch):
+    base = dados.dados_da_sessao(SAN_RAFAEL)
+    leitura = planilha.read
+    def read_instavel(spreadsheet, worksheet, ttl=None):
+        if worksheet == WORKSHEET_CONTROLE:
+            raise ConnectionError("sem rede")
+        return leitura(spreadsheet, worksheet, ttl)
+    monkeypatch.setattr(planilha, "read", read_instavel)
+
+    # Não pode cair no caminho "sem aba Controle" e regravar o carimbo como 1
+    with pytest.raises(ConnectionError):
+        dados.salvar_dados(_editar(base, "R", 120.0), SAN_RAFAEL)
+    assert planilha.gravacoes == []
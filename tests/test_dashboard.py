@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import dados
+from conftest import PlanilhaFalsa
+from dados import COLUNA_VERSAO, WORKSHEET_CONTROLE, WORKSHEET_DADOS
+from predios import SAN_RAFAEL
+
+PAGINA = """
+from paginas.dashboard import renderizar
+from predios import SAN_RAFAEL
+renderizar(SAN_RAFAEL, list(SAN_RAFAEL.categorias_padrao), list(SAN_RAFAEL.unidades_padrao))
+"""
+
+def _lancamento(id_, data, tipo, categoria, descricao, valor):
+    return {"ID": id_, "Data": data, "Tipo": tipo, "Categoria": categoria, "Unidade": "Apto 101",
+            "Descrição": descricao, "Valor": valor, "Status": "Ok", COLUNA_VERSAO: 1}
+
+@pytest.fixture
+def planilha(monkeypatch):
+    conn = PlanilhaFalsa({
+        WORKSHEET_DADOS: pd.DataFrame([
+            _lancamento("a", "2023-03-05", "Entrada", "Rateio Despesas (Água/Luz)", "Rateio", 100.0),
+            _lancamento("b", "2024-03-05", "Entrada", "Rateio Despesas (Água/Luz)", "Rateio", 50.0),
+            _lancamento("c", "2024-03-06", "Entrada", "Taxa Extra", "Extra: Pintura (['Todos'])", 20.0),
+            _lancamento("d", "2024-03-07", "Saída", "Manutenção", "Portão", 30.0),
+            _lancamento("e", "2024-04-05", "Entrada", "Rateio Despesas (Água/Luz)", "Rateio", 1000.0),
+        ]),
+        WORKSHEET_CONTROLE: pd.DataFrame({COLUNA_VERSAO: [1]}),
+    })
+    monkeypatch.setattr(dados, "get_conexao", lambda: conn)
+    dados._espelho_planilha.clear()
+    return conn
+
+def test_metricas_de_todos_os_anos_com_um_mes(planilha):
+    # "Todos" os anos + Mar: só os lançamentos de março de cada ano, como a tabela logo abaixo
+    at = AppTest.from_string(PAGINA, default_timeout=30).run()
+    at.selectbox[0].set_value("Todos")
+    at.selectbox[1].set_value(3)
+    at.run()
+
+    assert not at.exception
+    entradas, saidas, saldo = at.metric[0], at.metric[1], at.metric[2]
+    assert entradas.value == "R$ 170,00"
+    assert saidas.value == "R$ 30,00"
+    assert saldo.delta == "Res. Período: R$ 120,00"
+    # O acumulado continua sendo todo o histórico
+    assert saldo.value == "R$ 1.120,00"
+
+def test_cartoes_usam_a_planilha_atual_e_a_tabela_avisa_que_mudou(planilha):
+    at = AppTest.from_string(PAGINA, default_timeout=30).run()
+    at.selectbox[0].set_value("Todos").run()
+    assert at.metric[0].value == "R$ 1.170,00"
+    assert not at.info
+
+    # Outra pessoa inclui um lançamento
+    novo = _lancamento("f", "2024-05-05", "Entrada", "Rateio Despesas (Água/Luz)", "Rateio", 5.0)
+    dados.salvar_alteracoes(SAN_RAFAEL, inseridos=pd.DataFrame([novo]).drop(columns=COLUNA_VERSAO))
+    at.run()
+    assert at.metric[0].value == "R$ 1.175,00"
+    assert "A planilha mudou" in at.info[0].value
+
+    next(b for b in at.button if b.label == "🔄 Recarregar").click().run()
+    assert not at.info
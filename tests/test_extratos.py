@@ -0,0 +1,44 @@
+import io
+import zipfile
+
+import pandas as pd
+
+from predios import SAN_RAFAEL
+from relatorio.extratos import _montar_extratos, gerar_extratos_unidades
+from relatorio.modelo import periodo_corte
+
+def _livro():
+    linhas = [
+        ("2024-01-05", "Entrada", "Rateio Despesas (Água/Luz)", "Apto 101", "Rateio", 100.0),
+        ("2024-01-05", "Entrada", "Ajuste/Gorjeta", "Apto 101", "Pendência (Falta)", -30.0),
+        ("2024-02-05", "Entrada", "Rateio Despesas (Água/Luz)", "Apto 101", "Rateio", 100.0),
+        ("2024-02-10", "Entrada", "Ajuste/Gorjeta", "Apto 101", "Recuperação de Atrasados", 30.0),
+        ("2024-02-05", "Entrada", "Rateio Despesas (Água/Luz)", "Sala 01", "Rateio", 40.0),
+        ("2024-02-05", "Saída", "Pagto Luz", "Condomínio", "Conta Luz", 500.0),
+    ]
+    df = pd.DataFrame(linhas, columns=["Data", "Tipo", "Categoria", "Unidade", "Descrição", "Valor"])
+    df["Data"] = df["Data"].astype(str)
+    return df
+
+def test_saldo_corrido_por_unidade():
+    df = _livro().assign(Data=lambda d: pd.to_datetime(d["Data"]))
+    saldos_anteriores, linhas = _montar_extratos(df, *periodo_corte(2, 2024))
+
+    assert saldos_anteriores["Apto 101"] == -30.0
+    assert "Sala 01" not in saldos_anteriores
+    # (Data, Categoria, Descrição, Cobrança, Pago, Saldo)
+    assert [l[3:] for l in linhas["Apto 101"]] == [(100.0, 100.0, -30.0), (0.0, 30.0, 0.0)]
+    assert [l[3:] for l in linhas["Sala 01"]] == [(40.0, 40.0, 0.0)]
+    assert "Condomínio" not in linhas
+
+def test_zip_com_um_pdf_por_unidade_sem_alterar_o_livro():
+    df = _livro()
+    zip_bytes = gerar_extratos_unidades(df, 2, "Fev", 2024, ["Apto 101", "Sala 01", "Sala 02"], SAN_RAFAEL)
+
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+        assert sorted(zf.namelist()) == ["Extrato_Apto_101.pdf", "Extrato_Sala_01.pdf", "Extrato_Sala_02.pdf"]
+        assert all(zf.read(n).startswith(b"%PDF") for n in zf.namelist())
+    assert df["Data"].dtype == object  # a coluna do chamador continua como veio
+
+def test_sem_unidades_nao_gera_zip():
+    assert gerar_extratos_unidades(_livro(), 2, "Fev", 2024, [], SAN_RAFAEL) is None
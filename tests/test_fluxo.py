@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from relatorio.fluxo import reduzir_pontos
+
+def _serie(n=1000):
+    rng = np.random.default_rng(0)
+    serie = pd.DataFrame(
+        {"Entradas": rng.random(n) * 100, "Saídas": rng.random(n) * 90, "Extras": rng.random(n) * 5},
+        index=pd.date_range("2020-01-01", periods=n),
+    )
+    serie["Saldo"] = (serie["Entradas"] - serie["Saídas"] - serie["Extras"]).cumsum()
+    return serie
+
+def test_serie_curta_fica_igual():
+    serie = _serie(50)
+    pd.testing.assert_frame_equal(reduzir_pontos(serie, 400), serie)
+
+def test_fluxos_somam_desde_o_ponto_anterior():
+    serie = _serie()
+    reduzida = reduzir_pontos(serie, 100)
+
+    assert len(reduzida) <= 100
+    assert reduzida["Saldo"].max() == serie["Saldo"].max() and reduzida["Saldo"].min() == serie["Saldo"].min()
+    # A variação do saldo entre dois pontos do gráfico bate com os fluxos mostrados no hover
+    variacao = (reduzida["Entradas"] - reduzida["Saídas"] - reduzida["Extras"]).cumsum()
+    assert np.allclose(variacao, reduzida["Saldo"])
+    assert np.isclose(reduzida["Entradas"].sum(), serie["Entradas"].sum())
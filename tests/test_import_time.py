@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+from conftest import RAIZ
+
+# Módulos carregados na primeira renderização da "Calculadora de Rateio" / "Lançamentos Avulsos"
+CODIGO = "import dados, paginas.calculadora, paginas.avulsos"
+
+# Orçamento de partida (soma dos tempos cumulativos de primeiro nível, em ms).
+# Medido em ~380 ms nesta máquina (streamlit + pandas dominam); folga para CI lento.
+ORCAMENTO_MS = 1000
+
+# Dependências pesadas que só podem ser carregadas quando a página que as usa é aberta.
+# Obs: o próprio streamlit importa partes de "plotly" (tema); o que não pode vir é o plotly.express.
+PROIBIDOS = ("fpdf", "plotly.express", "streamlit_gsheets")
+
+def _medir():
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CODIGO],
+        cwd=RAIZ, capture_output=True, text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    assert r.returncode == 0, r.stderr[-2000:]
+    modulos, total_us = [], 0
+    for linha in r.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        _, cumulativo, nome = linha[len("import time:"):].split("|")
+        modulos.append(nome.strip())
+        # Só os imports de primeiro nível (nome com um único espaço à esquerda) entram na soma
+        if not nome[1:].startswith(" "):
+            total_us += int(cumulativo)
+    return modulos, total_us / 1000
+
+def test_dependencias_pesadas_nao_carregam_na_partida():
+    modulos, _ = _medir()
+    carregados = [m for m in modulos if any(m == p or m.startswith(p + ".") for p in PROIBIDOS)]
+    assert carregados == []
+
+def test_orcamento_de_tempo_de_import():
+    # Melhor de 3 para não reprovar por ruído da máquina
+    melhor_ms = min(_medir()[1] for _ in range(3))
+    assert melhor_ms < ORCAMENTO_MS, f"import levou {melhor_ms:.0f} ms (orçamento {ORCAMENTO_MS} ms)"
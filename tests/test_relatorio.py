@@ -0,0 +1,59 @@
+import pandas as pd
+
+from predios import SAN_RAFAEL
+from relatorio.modelo import construir_relatorio
+from relatorio.render_csv import renderizar_csv
+from relatorio.render_html import renderizar_html
+
+UNIDADES = ["Apto 101", "Apto 201", "Sala 01"]
+
+def _modelo():
+    linhas = [
+        ("2024-03-05", "Saída", "Pagto Água/Esgoto", "Condomínio", "Conta Água", 200.0),
+        ("2024-03-05", "Saída", "Pagto Luz", "Condomínio", "Conta Luz", 80.0),
+        ("2024-03-05", "Saída", "Pagto Limpeza", "Condomínio", "Faxina", 120.0),
+        ("2024-03-06", "Entrada", "Rateio Despesas (Água/Luz)", "Apto 101", "Rateio", 165.0),
+        ("2024-03-06", "Entrada", "Fundo de Reserva", "Apto 101", "Fundo", 20.0),
+        ("2024-03-06", "Entrada", "Taxa Extra", "Apto 101", "Extra: Pintura (['Só Aptos'])", 50.0),
+        ("2024-03-06", "Entrada", "Ajuste/Gorjeta", "Apto 201", "Pendência (Falta)", -15.0),
+        ("2024-03-06", "Entrada", "Rateio Despesas (Água/Luz)", "Apto 201", "Rateio", 100.0),
+        ("2024-03-07", "Entrada", "Aluguel Salão", "Condomínio", "Festa", 60.0),
+    ]
+    df = pd.DataFrame(linhas, columns=["Data", "Tipo", "Categoria", "Unidade", "Descrição", "Valor"])
+    return construir_relatorio(df, 3, "Mar", 2024, UNIDADES, SAN_RAFAEL)
+
+def test_html_traz_composicao_extras_ajustes_e_situacao():
+    pagina = renderizar_html(_modelo())
+    for trecho in [
+        "COMPOSIÇÃO (Rateio + Fundo + Extras)", "65% Água/Esgoto (R$ 65,00 x 2 unid)", "35% Água/Esgoto",
+        "Luz Condomínio", "Limpeza Prédio (R$ 60,00 x 2 unid)", "Fundo de Reserva (R$ 10,00 x 2 unid)",
+        "DESPESAS EXTRAS", "Pintura (R$ 25,00 x 2 unid)",
+        "AJUSTES / RECUPERAÇÕES", "Apto 201: Pendência (Falta)",
+        "Pagamento Integral", "Parcial (Falta", "EM ABERTO",
+        "TOTAL OUTRAS RECEITAS:",
+    ]:
+        assert trecho in pagina, trecho
+
+def test_csv_traz_todos_os_campos_do_modelo():
+    linhas = renderizar_csv(_modelo()).decode("utf-8-sig").splitlines()
+    assert linhas[0] == "Seção;Descrição;Valor;Situação"
+    texto = "\n".join(linhas)
+    for trecho in [
+        "2. ARRECADAÇÃO: SALAS - Composição;35% Água/Esgoto",
+        "3. ARRECADAÇÃO: APARTAMENTOS - Composição;Luz Condomínio (R$ 40,00 x 2 unid);80.00",
+        "3. ARRECADAÇÃO: APARTAMENTOS - Despesas Extras;Pintura (R$ 25,00 x 2 unid);50.00",
+        "3. ARRECADAÇÃO: APARTAMENTOS - Ajustes/Recuperações;Apto 201: Pendência (Falta);-15.00",
+        "3. ARRECADAÇÃO: APARTAMENTOS;Apto 101;235.00;Pagamento Integral",
+        "2. ARRECADAÇÃO: SALAS;Sala 01;0.00;EM ABERTO",
+        "Outras Receitas;TOTAL OUTRAS RECEITAS;60.00",
+    ]:
+        assert trecho in texto, trecho
+
+def test_cada_unidade_cai_em_um_so_grupo():
+    # "Apto 101 (Sala)" contém os dois nomes: entra só no primeiro grupo que casa, como na Calculadora
+    df = pd.DataFrame(
+        [("2024-03-06", "Entrada", "Rateio Despesas (Água/Luz)", "Apto 101 (Sala)", "Rateio", 90.0)],
+        columns=["Data", "Tipo", "Categoria", "Unidade", "Descrição", "Valor"],
+    )
+    modelo = construir_relatorio(df, 3, "Mar", 2024, ["Apto 101 (Sala)"], SAN_RAFAEL)
+    assert [b.total_arrecadado for b in modelo.blocos] == [90.0, 0.0]
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from predios import SAN_RAFAEL
+from simulador import grade_cenarios, simular_cenarios
+
+SO_APTOS = ["Apto 101", "Apto 201", "Apto 202"]  # Grupo "Sala" sem unidades: qtd_grupo = 1, mas ninguém paga
+
+def _cotas_linha_a_linha(predio, lista_unis, cenario):
+    # Mesma conta da "Calcular e Pré-Visualizar" da Calculadora, um cenário por vez
+    cotas, total = {}, 0.0
+    for grupo in predio.grupos:
+        rateio = predio.rateio_grupo(lista_unis, grupo, cenario["Água"], cenario["Luz"], cenario["Limpeza"])
+        alvo = cenario["Ratear Para"]
+        extra = cenario["Extra Total"] / predio.divisor_alvo(lista_unis, alvo) if predio.aplica_alvo(alvo, grupo) else 0.0
+        cota = rateio + cenario["Fundo"] + extra
+        cotas[f"Cota {grupo.titulo.title()}"] = cota
+        total += cota * len(predio.unidades_do_grupo(lista_unis, grupo))
+    return cotas, total
+
+@pytest.mark.parametrize("lista_unis", [list(SAN_RAFAEL.unidades_padrao), SO_APTOS])
+def test_vetorizado_bate_com_a_calculadora(lista_unis):
+    cenarios = grade_cenarios([0.0, 50.0], [300.0, 1000.5], [80.0], [0.0, 120.0], [0.0, 240.0], SAN_RAFAEL.alvos_rateio)
+    resultado = simular_cenarios(SAN_RAFAEL, lista_unis, cenarios)
+
+    assert len(resultado) == 2 * 2 * 2 * 2 * len(SAN_RAFAEL.alvos_rateio)
+    for _, linha in resultado.iterrows():
+        cotas, total = _cotas_linha_a_linha(SAN_RAFAEL, lista_unis, linha)
+        for coluna, cota in cotas.items():
+            assert np.isclose(linha[coluna], cota), (coluna, linha.to_dict())
+        assert np.isclose(linha["Total Arrecadado"], total), linha.to_dict()
+
+def test_grupo_sem_unidades_nao_entra_no_total():
+    cenarios = grade_cenarios([10.0], [1000.0], [0.0], [0.0], [0.0], ["Todos"])
+    linha = simular_cenarios(SAN_RAFAEL, SO_APTOS, cenarios).iloc[0]
+
+    # 35% da água sobre qtd 1 aparece na cota, mas nenhuma sala paga
+    assert np.isclose(linha["Cota Salas"], 350.0 + 10.0)
+    assert np.isclose(linha["Total Arrecadado"], linha["Cota Apartamentos"] * len(SO_APTOS))